@@ -13,7 +13,9 @@ from coral.agents.base import BaseAgent, ExtractedSession, discover_skills
 from coral.hooks.utils import resolve_session_id, truncate
 from coral.tools.utils import HISTORY_PATH
 
-SUMMARY_RE = re.compile(r"^[\s\u25cf\u23fa]*\|\|PULSE:SUMMARY (.*?)\|\|", re.MULTILINE)
+SUMMARY_RE = re.compile(
+    r"^[\s\u25cf\u23fa]*\|\|PULSE:SUMMARY ([^|\n]*(?:\|[^|\n]+)*)\|\|", re.MULTILINE
+)
 
 FTS_BODY_CAP = 50_000
 
@@ -492,7 +494,20 @@ class ClaudeAgent(BaseAgent):
             candidate = HISTORY_PATH / encoded / f"{session_id}.jsonl"
             if candidate.exists():
                 return candidate
-        for jsonl_path in HISTORY_PATH.rglob(f"{session_id}.jsonl"):
+        # Transcripts normally sit one level down (<projects>/<encoded cwd>/<id>.jsonl),
+        # so probe each project dir before falling back to an rglob of the
+        # whole tree, which also walks every subagent transcript directory.
+        name = f"{session_id}.jsonl"
+        try:
+            with os.scandir(HISTORY_PATH) as it:
+                for entry in it:
+                    if entry.is_dir():
+                        candidate = Path(entry.path, name)
+                        if candidate.is_file():
+                            return candidate
+        except OSError:
+            pass
+        for jsonl_path in HISTORY_PATH.rglob(name):
             return jsonl_path
         return None
 
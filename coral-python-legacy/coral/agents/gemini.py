@@ -10,7 +10,9 @@ from typing import Any
 from coral.agents.base import BaseAgent, ExtractedSession
 from coral.tools.utils import GEMINI_HISTORY_BASE
 
-SUMMARY_RE = re.compile(r"^[\s\u25cf\u23fa]*\|\|PULSE:SUMMARY (.*?)\|\|", re.MULTILINE)
+SUMMARY_RE = re.compile(
+    r"^[\s\u25cf\u23fa]*\|\|PULSE:SUMMARY ([^|\n]*(?:\|[^|\n]+)*)\|\|", re.MULTILINE
+)
 
 FTS_BODY_CAP = 50_000
 
@@ -127,7 +127,7 @@ async def get_history_sessions(
 
             # If still empty, fall back to old file-scan method
             if result["total"] == 0:
-                sessions = load_history_sessions()
+                sessions = await asyncio.to_thread(load_history_sessions)
                 metadata = await store.get_all_session_metadata()
                 for s in sessions:
                     meta = metadata.get(s["session_id"])
@@ -240,7 +240,8 @@ async def trigger_indexer_refresh():
 @router.get("/api/sessions/history/{session_id}")
 async def get_history_session_detail(session_id: str):
     """Get all messages for a historical session."""
-    messages = load_history_session_messages(session_id)
+    # Scans every transcript file under the agents' history dirs
+    messages = await asyncio.to_thread(load_history_session_messages, session_id)
     if not messages:
         return {"error": f"Session '{session_id}' not found"}
     return {"session_id": session_id, "messages": messages}
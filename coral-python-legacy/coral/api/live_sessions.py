@@ -14,7 +14,7 @@ from fastapi import APIRouter, Query, WebSocket, WebSocketDisconnect
 from coral.tools.session_manager import (
     discover_coral_agents,
     get_agent_log_path,
-    get_log_status,
+    get_log_statuses,
     restart_session,
     launch_claude_session,
 )
@@ -33,6 +33,7 @@ from coral.tools.tmux_manager import (
     resize_pane_target,
     find_pane_target,
     _find_pane,
+    invalidate_pane_cache,
 )
 from coral.agents import get_agent
 from coral.tools.log_streamer import get_log_snapshot
@@ -130,14 +131,25 @@ async def _build_session_list(include_commands: bool = False) -> list[dict]:
     except Exception:
         all_unread = {}
 
+    # Read every agent's log in one worker-thread hop rather than blocking
+    # the event loop once per agent.  A single log is read inline: one
+    # pread on its open fd is cheaper than the thread handoff.
+    log_paths = [a["log_path"] for a in agents]
+    if len(log_paths) > 1:
+        log_infos = await asyncio.to_thread(get_log_statuses, log_paths)
+    else:
+        log_infos = get_log_statuses(log_paths)
+
     results = []
-    for agent in agents:
+    for agent, log_info in zip(agents, log_infos):
         # Self-heal: if the log file is missing but the tmux session is alive,
         # recreate the file and re-establish pipe-pane logging.  This handles
         # the case where a log file was accidentally deleted while the cat
         # pipe-pane process still had an open fd to the removed inode.
+        # A missing log already shows up in the batch read as no staleness,
+        # so this needs no extra stat per agent.
         log_path = agent["log_path"]
-        if not Path(log_path).exists() and agent.get("tmux_session"):
+        if log_info["staleness_seconds"] is None and agent.get("tmux_session"):
             try:
                 from coral.tools.utils import run_cmd
                 tmux_sess = agent["tmux_session"]
@@ -154,7 +166,6 @@ async def _build_session_list(include_commands: bool = False) -> list[dict]:
             except Exception:
                 pass
 
-        log_info = get_log_status(log_path)
         name = agent["agent_name"]
         sid = agent.get("session_id")
 
@@ -297,8 +308,8 @@ async def _send_auto_accept(tmux_session: str) -> None:
     from coral.tools.utils import run_cmd
     try:
         await asyncio.sleep(0.5)  # Brief delay to let the prompt render
-        await run_cmd("tmux", "send-keys", "-t", tmux_session, "y", timeout=5.0)
-        await run_cmd("tmux", "send-keys", "-t", tmux_session, "Enter", timeout=5.0)
+        # One send-keys invocation carries both keys, in order
+        await run_cmd("tmux", "send-keys", "-t", tmux_session, "y", "Enter", timeout=5.0)
     except Exception:
         log.warning("Failed to auto-accept in session %s", tmux_session)
 
@@ -339,8 +350,11 @@ async def get_live_session_detail(
     log_path = get_agent_log_path(name, agent_type, session_id=session_id)
     if not log_path:
         return {"error": f"Agent '{name}' not found"}
-    snapshot = get_log_snapshot(str(log_path))
-    pane_text = await capture_pane(name, agent_type=agent_type, session_id=session_id)
+    # Parse the log in a worker thread while tmux captures the pane
+    snapshot, pane_text = await asyncio.gather(
+        asyncio.to_thread(get_log_snapshot, str(log_path)),
+        capture_pane(name, agent_type=agent_type, session_id=session_id),
+    )
     return {
         "name": name,
         "session_id": session_id,
@@ -521,6 +535,18 @@ async def refresh_live_session_files(name: str, body: dict | None = None):
     return {"agent_name": name, "files": files_list}
 
 
+def _read_text_file(path: str) -> str:
+    with open(path, "r", errors="replace") as f:
+        return f.read()
+
+
+def _write_text_file(path: str, content: str) -> None:
+    with open(path, "w") as f:
+        f.write(content)
+
+
+# Working-tree files can be large; the endpoints below read and write them
+# in a worker thread so the event loop keeps serving polls meanwhile.
 @router.get("/api/sessions/live/{name}/diff")
 async def get_file_diff(name: str, filepath: str = Query(...), session_id: str | None = None):
     """Return the unified diff for a single file in the agent's working tree."""
@@ -550,8 +576,7 @@ async def get_file_diff(name: str, filepath: str = Query(...), session_id: str |
             return {"filepath": filepath, "diff": "", "working_directory": workdir}
         if os.path.isfile(full_path):
             try:
-                with open(full_path, "r", errors="replace") as f:
-                    content = f.read()
+                content = await asyncio.to_thread(_read_text_file, full_path)
                 lines = content.split("\n")
                 diff_text = (
                     f"diff --git a/{filepath} b/{filepath}\n"
@@ -584,8 +609,7 @@ async def get_file_content(name: str, filepath: str = Query(...), session_id: st
         return {"error": "File not found"}
 
     try:
-        with open(full_path, "r", errors="replace") as f:
-            content = f.read()
+        content = await asyncio.to_thread(_read_text_file, full_path)
         return {"filepath": filepath, "content": content, "working_directory": workdir}
     except Exception as e:
         return {"error": str(e)}
@@ -609,8 +633,7 @@ async def save_file_content(name: str, body: dict, filepath: str = Query(...), s
         return {"error": "Path traversal not allowed"}
 
     try:
-        with open(full_path, "w") as f:
-            f.write(content)
+        await asyncio.to_thread(_write_text_file, full_path, content)
         return {"ok": True, "filepath": filepath}
     except Exception as e:
         return {"error": str(e)}
@@ -1021,6 +1044,7 @@ async def create_agent_event(name: str, body: dict):
         name, event_type, summary,
         tool_name=tool_name, session_id=session_id, detail_json=detail_json,
     )
+    notify_sessions_changed()
 
     # Auto-accept: if this session has auto_accept enabled and the event
     # is a notification (permission prompt), send "y" + Enter.
@@ -1109,6 +1133,7 @@ async def sleep_team(board_name: str):
             )
             if pane:
                 await run_cmd("tmux", "kill-session", "-t", pane["session_name"])
+                invalidate_pane_cache()
                 killed += 1
         except Exception:
             log.debug("Failed to kill session %s during sleep", sess["session_id"][:8])
@@ -1177,6 +1202,7 @@ async def sleep_all():
             )
             if pane:
                 await run_cmd("tmux", "kill-session", "-t", pane["session_name"])
+                invalidate_pane_cache()
                 killed += 1
         except Exception:
             log.debug("Failed to kill tmux for session %s during sleep-all", sid[:8])
@@ -1239,6 +1265,7 @@ async def sleep_session(session_id: str):
         )
         if pane:
             await run_cmd("tmux", "kill-session", "-t", pane["session_name"])
+            invalidate_pane_cache()
     except Exception:
         log.debug("Failed to kill tmux for session %s during sleep", session_id[:8])
 
@@ -1278,6 +1305,48 @@ async def wake_session(session_id: str):
 # ── WebSocket Endpoints ─────────────────────────────────────────────────────
 
 
+class _ChangeSignal:
+    """Broadcast "sessions changed" to every /ws/coral client at once.
+
+    Clients don't register per wait: they remember the generation they last
+    built from, so a change that lands mid-rebuild is seen on the next wait,
+    and one notify() wakes all current waiters through a shared event.
+    """
+
+    def __init__(self) -> None:
+        self.generation = 0
+        self._event: asyncio.Event | None = None
+        self._loop: asyncio.AbstractEventLoop | None = None
+
+    def notify(self) -> None:
+        self.generation += 1
+        if self._event is not None:
+            self._event.set()
+            self._event = None
+
+    async def wait(self, seen: int, timeout: float) -> None:
+        """Return once the generation moves past *seen*, or after *timeout*."""
+        if self.generation != seen:
+            return
+        loop = asyncio.get_running_loop()
+        if self._event is None or self._loop is not loop:
+            self._event, self._loop = asyncio.Event(), loop
+        try:
+            await asyncio.wait_for(self._event.wait(), timeout)
+        except asyncio.TimeoutError:
+            pass
+
+
+# Set when an agent log or event changes so the session list is pushed
+# without waiting a full poll.
+_session_changes = _ChangeSignal()
+
+
+def notify_sessions_changed() -> None:
+    """Wake every /ws/coral client to rebuild and push the session list."""
+    _session_changes.notify()
+
+
 @router.websocket("/ws/terminal/{name}")
 async def ws_terminal(websocket: WebSocket, name: str):
     """Bidirectional terminal WebSocket.
@@ -1332,11 +1401,13 @@ async def ws_terminal(websocket: WebSocket, name: str):
         immediately captures the pane and pushes the update. This gives
         near-real-time latency with zero cost when idle.
 
-        Fallback: 10ms stat polling on the log file (kernel syscall, ~0.01ms)
-        is vastly cheaper than capture-pane subprocess spawns (~2ms each).
+        Log writes arrive as inotify/FSEvents notifications via watchfiles,
+        so an idle terminal only wakes for the 2s heartbeat.  Fallback when
+        the file can't be watched: 10ms stat polling on the log file (kernel
+        syscall, ~0.01ms), still far cheaper than capture-pane spawns (~2ms).
 
         Three triggers cause a capture:
-        - Log file mtime changed (new output from agent)
+        - Log file changed (new output from agent)
         - User input event (keystroke echo)
         - Heartbeat every 2s (detect pane disappearance)
         """
@@ -1359,6 +1430,17 @@ async def ws_terminal(websocket: WebSocket, name: str):
 
         last_cursor = (None, None)
 
+        # Log change notifications share input_event with keystrokes
+        # (checked up front so a missing watchfiles goes straight to polling)
+        watch_task = None
+        if log_path:
+            from coral.background_tasks.log_watcher import watch_log_file, watchfiles_available
+            from coral.config import TERMINAL_LOG_WATCH_DEBOUNCE_MS
+            if watchfiles_available():
+                watch_task = asyncio.create_task(watch_log_file(
+                    str(log_path), input_event.set, TERMINAL_LOG_WATCH_DEBOUNCE_MS,
+                ))
+
         async def _do_capture():
             """Capture pane and send update if content or cursor changed."""
             nonlocal last_content, last_cursor, pane_gone_notified, target, last_capture_time
@@ -1430,6 +1512,26 @@ async def ws_terminal(websocket: WebSocket, name: str):
                     await _do_capture()
                     continue
 
+                if watch_task is not None and not watch_task.done():
+                    # Also wake if the watcher stops, to fall back to polling
+                    waiter = asyncio.ensure_future(input_event.wait())
+                    try:
+                        await asyncio.wait(
+                            (waiter, watch_task), timeout=2.0,
+                            return_when=asyncio.FIRST_COMPLETED,
+                        )
+                    finally:
+                        waiter.cancel()
+                    # Cleared before capturing so a change during it isn't lost
+                    input_event.clear()
+                    # Defer rather than drop a capture inside the rate limit:
+                    # the event that asked for it has already been consumed
+                    delay = min_capture_interval - (_time.monotonic() - last_capture_time)
+                    if delay > 0:
+                        await asyncio.sleep(delay)
+                    await _do_capture()
+                    continue
+
                 # Check if log file changed (cheap stat syscall)
                 file_changed = False
                 if log_path:
@@ -1457,52 +1559,86 @@ async def ws_terminal(websocket: WebSocket, name: str):
             closed = True
         except Exception:
             closed = True
+        finally:
+            if watch_task is not None:
+                watch_task.cancel()
 
     # Run reader and writer concurrently
     await asyncio.gather(_reader(), _writer())
 
 
+async def _build_ws_state() -> tuple[int, list[dict], list[dict]]:
+    """Build (generation, sessions, active_runs) for a /ws/coral refresh."""
+    generation = _session_changes.generation
+    results = await _build_session_list()
+    results = await _exclude_job_sessions(results)
+
+    # Fetch active job runs for Jobs sidebar
+    active_runs = []
+    if schedule_store:
+        try:
+            active_runs = await schedule_store.list_active_runs()
+            for r in active_runs:
+                if r.get("job_name") == "__oneshot__":
+                    r["job_name"] = None
+        except Exception:
+            pass
+    return generation, results, active_runs
+
+
+# The /ws/coral refresh currently being built, shared by every client
+_ws_state_task: asyncio.Task | None = None
+
+
+async def _shared_ws_state() -> tuple[int, list[dict], list[dict]]:
+    """Return the /ws/coral state, joining a build already in flight.
+
+    Every client wakes on the same change notification; the first starts
+    the build and the rest await it instead of repeating discovery, log
+    reads and DB queries per browser tab.  The returned generation is the
+    one the build started from, so a change that lands mid-build still
+    triggers another refresh.
+    """
+    global _ws_state_task
+    task = _ws_state_task
+    if task is None or task.done() or task.get_loop() is not asyncio.get_running_loop():
+        task = _ws_state_task = asyncio.ensure_future(_build_ws_state())
+    # Shielded so one client disconnecting doesn't cancel the others' result
+    return await asyncio.shield(task)
+
+
 @router.websocket("/ws/coral")
 async def ws_coral(websocket: WebSocket):
-    """Stream coral-wide session list updates (polls every 3s).
+    """Stream coral-wide session list updates.
+
+    Refreshes when notify_sessions_changed fires (agent log writes, hook
+    events), at most every WS_MIN_INTERVAL_S, and otherwise every
+    WS_POLL_INTERVAL_S.
 
     First message is a full ``coral_update`` with all sessions.
     Subsequent messages are ``coral_diff`` with only changed/removed sessions
     to reduce bandwidth. Full session objects are sent per changed agent
     (no field-level diffs) as recommended by security review.
     """
+    from coral.config import WS_MIN_INTERVAL_S, WS_POLL_INTERVAL_S
+
     await websocket.accept()
 
-    # Per-session state tracking for diff calculation
-    prev_sessions: dict[str, str] = {}  # session key -> json string
-    prev_runs_json: str = "[]"
+    # Per-session state tracking for diff calculation.  Plain dict equality
+    # is a C-level compare; no need to serialise every session each poll.
+    prev_sessions: dict[str, dict] = {}  # session key -> session dict
+    prev_runs: list[dict] = []
     first_message = True
 
     try:
         while True:
-            results = await _build_session_list()
-            results = await _exclude_job_sessions(results)
-
-            # Fetch active job runs for Jobs sidebar
-            active_runs = []
-            if schedule_store:
-                try:
-                    active_runs = await schedule_store.list_active_runs()
-                    for r in active_runs:
-                        if r.get("job_name") == "__oneshot__":
-                            r["job_name"] = None
-                except Exception:
-                    pass
+            built_at = time.monotonic()
+            seen, results, active_runs = await _shared_ws_state()
 
             # Build per-session state map
-            curr_sessions: dict[str, str] = {}
-            session_by_key: dict[str, dict] = {}
-            for s in results:
-                key = s.get("session_id") or s["name"]
-                curr_sessions[key] = json.dumps(s, sort_keys=True)
-                session_by_key[key] = s
-
-            curr_runs_json = json.dumps(active_runs, sort_keys=True)
+            curr_sessions: dict[str, dict] = {
+                s.get("session_id") or s["name"]: s for s in results
+            }
 
             if first_message:
                 # Always send full state on first message
@@ -1512,17 +1648,17 @@ async def ws_coral(websocket: WebSocket):
                     "active_runs": active_runs,
                 })
                 prev_sessions = curr_sessions
-                prev_runs_json = curr_runs_json
+                prev_runs = active_runs
                 first_message = False
             else:
                 # Calculate diff: changed + removed sessions
-                changed = []
-                for key, s_json in curr_sessions.items():
-                    if prev_sessions.get(key) != s_json:
-                        changed.append(session_by_key[key])
+                changed = [
+                    s for key, s in curr_sessions.items()
+                    if prev_sessions.get(key) != s
+                ]
 
                 removed = [k for k in prev_sessions if k not in curr_sessions]
-                runs_changed = curr_runs_json != prev_runs_json
+                runs_changed = active_runs != prev_runs
 
                 if changed or removed or runs_changed:
                     payload: dict = {"type": "coral_diff"}
@@ -1534,10 +1670,13 @@ async def ws_coral(websocket: WebSocket):
                         payload["active_runs"] = active_runs
                     await websocket.send_json(payload)
                     prev_sessions = curr_sessions
-                    prev_runs_json = curr_runs_json
+                    prev_runs = active_runs
 
-            from coral.config import WS_POLL_INTERVAL_S
-            await asyncio.sleep(WS_POLL_INTERVAL_S)
+            await _session_changes.wait(seen, WS_POLL_INTERVAL_S)
+            # Coalesce bursts of change notifications into one refresh
+            delay = WS_MIN_INTERVAL_S - (time.monotonic() - built_at)
+            if delay > 0:
+                await asyncio.sleep(delay)
     except WebSocketDisconnect:
         pass
     except Exception:
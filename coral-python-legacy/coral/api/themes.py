@@ -10,7 +10,7 @@ import shutil
 
 from fastapi import APIRouter, UploadFile, File
 
-from coral.tools.utils import get_package_dir
+from coral.tools.utils import get_package_dir, write_json_atomic
 
 log = logging.getLogger(__name__)
 
@@ -213,7 +213,7 @@ async def save_theme(name: str, body: dict):
         "base": body.get("base", "dark"),
         "variables": body.get("variables", {}),
     }
-    path.write_text(json.dumps(theme_data, indent=2))
+    write_json_atomic(path, theme_data, indent=2)
     return {"ok": True, "name": name}
 
 
@@ -251,7 +251,7 @@ async def import_theme(file: UploadFile = File(...)):
         "variables": data.get("variables", {}),
     }
     path = get_themes_dir() / f"{safe_name}.json"
-    path.write_text(json.dumps(theme_data, indent=2))
+    write_json_atomic(path, theme_data, indent=2)
     return {"ok": True, "name": safe_name}
 
 
@@ -5,13 +5,12 @@ from __future__ import annotations
 import asyncio
 import logging
 import os
-from pathlib import Path
 from typing import Any
 
 from coral.tools.session_manager import discover_coral_agents
 from coral.tools.tmux_manager import _find_pane
 from coral.store import CoralStore
-from coral.tools.utils import run_cmd, get_diff_base, HISTORY_PATH
+from coral.tools.utils import run_cmd, get_diff_base
 
 log = logging.getLogger(__name__)
 
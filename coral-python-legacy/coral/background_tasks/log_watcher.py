@@ -0,0 +1,85 @@
+"""Agent log watcher — wakes dashboard clients when a coral log changes."""
+
+from __future__ import annotations
+
+import logging
+import os
+from typing import Callable
+
+from coral.tools.utils import LOG_DIR
+
+log = logging.getLogger(__name__)
+
+
+def _is_coral_log(change, path: str) -> bool:
+    name = os.path.basename(path)
+    return name.endswith(".log") and "_coral_" in name
+
+
+class LogWatcher:
+    """Calls *on_change* whenever agent logs in LOG_DIR are written.
+
+    Uses ``watchfiles`` (installed with ``uvicorn[standard]``) for
+    inotify/FSEvents notifications.  Without it, ``run_forever`` returns
+    immediately and clients keep their fixed polling interval.
+    """
+
+    def __init__(self, on_change: Callable[[], None]) -> None:
+        self._on_change = on_change
+
+    async def run_forever(self, debounce_ms: int = 1000) -> None:
+        try:
+            from watchfiles import awatch
+        except ImportError:
+            log.info("watchfiles not installed; session updates use polling only")
+            return
+
+        try:
+            async for _changes in awatch(
+                LOG_DIR, watch_filter=_is_coral_log, recursive=False,
+                debounce=debounce_ms,
+            ):
+                self._on_change()
+        except Exception:
+            log.exception("LogWatcher stopped; session updates fall back to polling")
+
+
+def watchfiles_available() -> bool:
+    """Return True when ``watchfiles`` notifications can be used."""
+    try:
+        import watchfiles  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+async def watch_log_file(path: str, on_change: Callable[[], None], debounce_ms: int = 50) -> None:
+    """Call *on_change* whenever the single log file at *path* is written.
+
+    Watches the parent directory filtered to the file's name rather than
+    the file itself, so a log replaced at the same path (deleted and
+    recreated) keeps notifying.  Each watch holds one worker thread while
+    it runs.  Returns when watchfiles isn't installed or the directory can
+    no longer be watched, so callers can tell (``task.done()``) and fall
+    back to polling.
+    """
+    try:
+        from watchfiles import awatch
+    except ImportError:
+        return
+
+    directory, name = os.path.split(os.path.abspath(path))
+
+    def _is_log(change, changed_path: str) -> bool:
+        # Compare names only: the watched directory may be reported under
+        # its resolved path (e.g. /private/tmp for /tmp on macOS)
+        return os.path.basename(changed_path) == name
+
+    try:
+        async for _changes in awatch(
+            directory, watch_filter=_is_log, recursive=False,
+            debounce=debounce_ms, step=max(1, debounce_ms // 2),
+        ):
+            on_change()
+    except Exception:
+        log.debug("Stopped watching %s; falling back to polling", path)
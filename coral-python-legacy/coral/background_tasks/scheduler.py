@@ -10,6 +10,7 @@ from zoneinfo import ZoneInfo
 
 from coral.store.schedule import ScheduleStore
 from coral.tools.cron_parser import next_fire_time
+from coral.tools.tmux_manager import invalidate_pane_cache
 from coral.tools.utils import run_cmd
 
 log = logging.getLogger(__name__)
@@ -203,6 +204,7 @@ class JobScheduler:
             # Try to find and kill the tmux session
             session_name = f"{agent_type}-{run['session_id']}"
             await run_cmd("tmux", "kill-session", "-t", session_name, timeout=5.0)
+            invalidate_pane_cache()
 
         await self._store.update_scheduled_run(
             run_id, status="killed", exit_reason="user_cancelled",
@@ -373,6 +375,7 @@ class JobScheduler:
         else:
             log.warning("Run %d timed out after %ds, killing", run_id, max_duration)
             await run_cmd("tmux", "kill-session", "-t", session_name, timeout=5.0)
+            invalidate_pane_cache()
             await self._store.update_scheduled_run(
                 run_id, status="killed",
                 exit_reason="timeout",
@@ -8,7 +8,6 @@ from __future__ import annotations
 
 import asyncio
 import logging
-from typing import Any
 
 from coral.agents import get_all_agents
 from coral.store import CoralStore
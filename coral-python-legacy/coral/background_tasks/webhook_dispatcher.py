@@ -5,8 +5,6 @@ from __future__ import annotations
 import asyncio
 import logging
 from datetime import datetime, timezone, timedelta
-from typing import Any
-from urllib.parse import urlparse
 
 log = logging.getLogger(__name__)
 
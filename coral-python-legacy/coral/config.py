@@ -34,7 +34,10 @@ BOARD_NOTIFIER_INTERVAL_S = 5      # Message board notification interval
 REMOTE_POLLER_INTERVAL_S = 5       # Remote board polling interval
 WAL_CHECKPOINT_INTERVAL_S = 300    # Periodic WAL checkpoint (5 minutes)
 # ── WebSocket ────────────────────────────────────────────────────────────
-WS_POLL_INTERVAL_S = 5            # Dashboard WebSocket refresh interval
+WS_POLL_INTERVAL_S = 5            # Dashboard WebSocket refresh interval (heartbeat when idle)
+WS_MIN_INTERVAL_S = 1             # Minimum gap between change-driven refreshes
+LOG_WATCH_DEBOUNCE_MS = 1000      # Group agent log writes into one change notification
+TERMINAL_LOG_WATCH_DEBOUNCE_MS = 50  # Terminal stream: log writes -> pane capture latency
 
 # ── Message board (frontend) ────────────────────────────────────────────
 BOARD_PAGE_SIZE = 50               # Messages per page in board UI
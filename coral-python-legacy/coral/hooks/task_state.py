@@ -30,6 +30,31 @@ def _cache_read(task_id: str) -> str:
         return ""
 
 
+def _dashboard_id_path(session_id: str, task_id: str) -> str:
+    return os.path.join(cache_dir(), f"dash_{session_id}_{task_id}")
+
+
+def _dashboard_id_write(session_id: str, task_id: str, dashboard_id: int) -> None:
+    """Remember the dashboard row created for an agent task."""
+    try:
+        with open(_dashboard_id_path(session_id, task_id), "w") as f:
+            f.write(str(dashboard_id))
+    except OSError:
+        pass
+
+
+def _dashboard_id_pop(session_id: str, task_id: str) -> int | None:
+    """Return and forget the cached dashboard row ID."""
+    path = _dashboard_id_path(session_id, task_id)
+    try:
+        with open(path) as f:
+            dashboard_id = int(f.read().strip())
+        os.unlink(path)
+        return dashboard_id
+    except (OSError, ValueError):
+        return None
+
+
 def main():
     """Read hook JSON from stdin, call Coral API to create/complete tasks."""
     try:
@@ -64,12 +89,14 @@ def main():
         payload = {"title": subject}
         if session_id:
             payload["session_id"] = session_id
-        coral_api(base, "POST", f"/api/sessions/live/{agent_name}/tasks", payload)
+        created = coral_api(base, "POST", f"/api/sessions/live/{agent_name}/tasks", payload)
         # Cache using the ID so TaskUpdate can look it up later
         cache_id = task_event["task_id"]
         debug_log(f"TaskCreate: cache_id={cache_id} subject={subject}")
         if cache_id:
             _cache_write(cache_id, subject)
+            if session_id and isinstance(created, dict) and created.get("id"):
+                _dashboard_id_write(session_id, cache_id, created["id"])
 
     elif task_event["action"] == "update":
         task_id = task_event["task_id"]
@@ -85,7 +112,18 @@ def main():
             title = subject or (_cache_read(task_id) if task_id else "")
             debug_log(f"TaskUpdate {status}: task_id={task_id} resolved_title={title}")
             completed_value = 1 if status == "completed" else 2
-            if title:
+            # Completing a row created by this hook: PATCH it directly instead
+            # of fetching the agent's whole task list.  in_progress updates
+            # keep going through the lookup, which skips rows already
+            # completed (e.g. by the user in the dashboard).
+            dashboard_id = (
+                _dashboard_id_pop(session_id, task_id)
+                if status == "completed" and session_id and task_id else None
+            )
+            if dashboard_id is not None:
+                debug_log(f"Setting {status}: cached dashboard_id={dashboard_id}")
+                coral_api(base, "PATCH", f"/api/sessions/live/{agent_name}/tasks/{dashboard_id}", {"completed": completed_value})
+            elif title:
                 qs = f"?session_id={session_id}" if session_id else ""
                 tasks = coral_api(base, "GET", f"/api/sessions/live/{agent_name}/tasks{qs}")
                 debug_log(f"Dashboard tasks: {json.dumps([t.get('title') for t in (tasks or [])])}")
@@ -4,6 +4,7 @@ import json
 import os
 import re
 import subprocess
+import time
 import urllib.request
 
 _TMUX_UUID_RE = re.compile(
@@ -66,8 +67,9 @@ def debug_log(msg: str) -> None:
                     f.write("--- log rotated ---\n")
         except OSError:
             pass
-        from datetime import datetime, timezone
-        ts = datetime.now(timezone.utc).strftime("%H:%M:%S.%f")[:-3]
+        # time.strftime avoids building a datetime (and importing the module) per line
+        now = time.time()
+        ts = f"{time.strftime('%H:%M:%S', time.gmtime(now))}.{int(now % 1 * 1000):03d}"
         with open(log_path, "a") as f:
             f.write(f"[{ts}] {msg}\n")
     except OSError:
@@ -91,6 +91,7 @@ def _load_state() -> dict | None:
 
 def _save_state(project: str, job_title: str) -> None:
     """Save the active project for this worktree."""
+    from coral.tools.utils import write_json_atomic
     state_dir = _get_state_dir()
     state_dir.mkdir(parents=True, exist_ok=True)
     data: dict = {
@@ -99,7 +100,7 @@ def _save_state(project: str, job_title: str) -> None:
         "session_id": _session_id(),
         "server_url": _resolve_server(),
     }
-    _state_file().write_text(json.dumps(data))
+    write_json_atomic(_state_file(), data)
 
 
 def _clear_state() -> None:
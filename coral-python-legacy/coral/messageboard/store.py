@@ -19,6 +19,9 @@ def get_db_path() -> Path:
     return get_data_dir() / "messageboard.db"
 
 
+# Broadcast mentions that notify every subscriber in ``mentions`` mode (lowercase)
+_BROADCAST_MENTIONS = ("@notify-all", "@notify_all", "@notifyall", "@all")
+
 # Kept for backward compatibility
 DB_DIR = Path.home() / ".coral"
 DB_PATH = DB_DIR / "messageboard.db"
@@ -438,6 +441,8 @@ class MessageBoardStore:
                 continue
 
             messages = [dict(r) for r in msg_rows]
+            # Lowercased once per project, shared by every mentions-mode subscriber
+            contents_lower: list[str] | None = None
 
             # Count per subscriber based on their receive_mode
             for sub in subs:
@@ -459,20 +464,18 @@ class MessageBoardStore:
                             continue
                         count += 1
                 elif receive_mode == "mentions":
-                    mention_terms = [
-                        "@notify-all", "@notify_all", "@notifyall", "@all",
-                        f"@{sid}",
-                    ]
+                    mention_terms = _BROADCAST_MENTIONS + (f"@{sid}".lower(),)
                     if job_title:
-                        mention_terms.append(f"@{job_title}")
+                        mention_terms += (f"@{job_title}".lower(),)
+                    if contents_lower is None:
+                        contents_lower = [msg["content"].lower() for msg in messages]
 
-                    for msg in messages:
+                    for msg, content_lower in zip(messages, contents_lower):
                         if msg["id"] <= last_read:
                             continue
                         if msg["session_id"] == sid:
                             continue
-                        content_lower = msg["content"].lower()
-                        if any(term.lower() in content_lower for term in mention_terms):
+                        if any(term in content_lower for term in mention_terms):
                             count += 1
                 else:
                     # Group-based mode
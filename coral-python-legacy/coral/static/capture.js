@@ -103,23 +103,50 @@ export async function refreshCapture() {
             }
         }
 
-        // ── Tasks ──
-        state.currentAgentTasks = data.tasks || [];
-        renderTaskList();
+        // ── Tasks ── (skip the re-render when nothing changed since last poll)
+        const tasks = data.tasks || [];
+        if (JSON.stringify(tasks) !== JSON.stringify(state.currentAgentTasks)) {
+            state.currentAgentTasks = tasks;
+            renderTaskList();
+        }
 
         // ── Events ──
-        state.currentAgentEvents = data.events || [];
-        renderEventTimeline();
+        const events = data.events || [];
+        if (JSON.stringify(events) !== JSON.stringify(state.currentAgentEvents)) {
+            state.currentAgentEvents = events;
+            renderEventTimeline();
+        }
 
     } catch (e) {
         console.error("Failed to refresh capture:", e);
     }
 }
 
+// Other live-session pollers ride the capture tick instead of installing
+// their own timers.  Key: poll function, Value: run every N ticks
+const _tickPollers = new Map();
+let _tickCount = 0;
+
+export function addCapturePoller(fn, everyTicks = 1) {
+    _tickPollers.set(fn, everyTicks);
+}
+
+export function removeCapturePoller(fn) {
+    _tickPollers.delete(fn);
+}
+
+function captureTick() {
+    _tickCount++;
+    refreshCapture();
+    for (const [fn, every] of _tickPollers) {
+        if (_tickCount % every === 0) fn();
+    }
+}
+
 export function startCaptureRefresh() {
     stopCaptureRefresh();
     refreshCapture();
-    state.captureInterval = setInterval(refreshCapture, CAPTURE_REFRESH_MS);
+    state.captureInterval = setInterval(captureTick, CAPTURE_REFRESH_MS);
 }
 
 export function stopCaptureRefresh() {
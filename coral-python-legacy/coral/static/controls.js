@@ -752,6 +752,9 @@ function clearAttachments() {
 
 export function updateSidebarActive() {
     document.querySelectorAll(".session-list li").forEach(li => li.classList.remove("active"));
+    // The classes were just cleared, so the live list must be rebuilt
+    const liveList = document.getElementById("live-sessions-list");
+    if (liveList) liveList._renderedHtml = null;
     if (state.liveSessions.length) renderLiveSessions(state.liveSessions);
 
     // Highlight the active history session by matching onclick session_id
@@ -1,10 +1,19 @@
 /* Live history view — renders JSONL messages as a read-only conversation log */
 
-import { state } from './state.js';
+import { state, CAPTURE_REFRESH_MS } from './state.js';
 import { escapeHtml } from './utils.js';
+import { addCapturePoller, removeCapturePoller } from './capture.js';
+
+// History is polled once a second, on every Nth capture refresh tick
+const HISTORY_POLL_TICKS = Math.max(1, Math.round(1000 / CAPTURE_REFRESH_MS));
+
+// A long transcript's first load renders only the newest messages; the
+// earlier ones are mounted when the user asks for them.
+const HISTORY_INITIAL_RENDER = 200;
 
-let historyPollInterval = null;
 let historyMessageCount = 0;
+let historyMessages = [];      // every message fetched for the current session
+let hiddenMessageCount = 0;    // leading historyMessages not yet rendered
 
 function renderMarkdown(text) {
     if (typeof marked !== 'undefined') {
@@ -205,7 +214,14 @@ export async function refreshLiveHistory() {
         const data = await resp.json();
 
         if (data.messages && data.messages.length > 0) {
-            for (const msg of data.messages) {
+            let messages = data.messages;
+            historyMessages.push(...messages);
+            if (historyMessageCount === 0 && messages.length > HISTORY_INITIAL_RENDER) {
+                hiddenMessageCount = messages.length - HISTORY_INITIAL_RENDER;
+                messages = messages.slice(hiddenMessageCount);
+                container.appendChild(renderShowEarlierButton(container));
+            }
+            for (const msg of messages) {
                 renderMessage(msg, container);
             }
             historyMessageCount = data.total;
@@ -219,21 +235,35 @@ export async function refreshLiveHistory() {
     }
 }
 
+function renderShowEarlierButton(container) {
+    const btn = document.createElement("button");
+    btn.className = "btn btn-small chat-show-earlier";
+    btn.textContent = `Show ${hiddenMessageCount} earlier messages`;
+    btn.addEventListener("click", () => {
+        // Re-render in order so tool results still attach to their cards
+        hiddenMessageCount = 0;
+        container.innerHTML = "";
+        for (const msg of historyMessages) {
+            renderMessage(msg, container);
+        }
+    });
+    return btn;
+}
+
 export function startLiveHistoryPoll() {
     stopLiveHistoryPoll();
     refreshLiveHistory();
-    historyPollInterval = setInterval(refreshLiveHistory, 1000);
+    addCapturePoller(refreshLiveHistory, HISTORY_POLL_TICKS);
 }
 
 export function stopLiveHistoryPoll() {
-    if (historyPollInterval) {
-        clearInterval(historyPollInterval);
-        historyPollInterval = null;
-    }
+    removeCapturePoller(refreshLiveHistory);
 }
 
 export function resetLiveHistory() {
     const container = document.getElementById("live-history-messages");
     if (container) container.innerHTML = "";
     historyMessageCount = 0;
+    historyMessages = [];
+    hiddenMessageCount = 0;
 }
@@ -593,6 +593,7 @@ export function renderLiveSessions(sessions) {
 
     if (!sessions.length) {
         list.innerHTML = '<li class="empty-state">No live sessions</li>';
+        list._renderedHtml = null;
         return;
     }
 
@@ -873,7 +874,14 @@ export function renderLiveSessions(sessions) {
 
     }
 
+    // Most updates change nothing the sidebar shows (e.g. staleness only);
+    // skip rebuilding the list DOM and re-attaching its listeners then.
+    if (list._renderedHtml === html) {
+        syncMobileAgentList();
+        return;
+    }
     list.innerHTML = html;
+    list._renderedHtml = html;
 
     // Attach hover listeners for fixed-position tooltips
     for (const item of list.querySelectorAll(".session-group-item")) {
@@ -1116,17 +1124,34 @@ export function renderHistoryChat(messages) {
     container.scrollTop = container.scrollHeight;
 }
 
+// The live-session header updaters run on every websocket tick; the header
+// is static template markup, so its nodes are looked up once and reused.
+// Key: "<element id> <selector>", Value: element
+const _headerNodes = new Map();
+
+function headerNode(id, selector) {
+    const key = `${id} ${selector}`;
+    let node = _headerNodes.get(key);
+    if (!node || !node.isConnected) {
+        const el = document.getElementById(id);
+        node = el && (selector ? el.querySelector(selector) : el);
+        if (node) _headerNodes.set(key, node);
+    }
+    return node;
+}
+
 export function updateSessionStatus(status) {
-    const el = document.getElementById("session-status");
-    if (status) {
-        el.querySelector(".status-text").textContent = status;
+    const text = headerNode("session-status", ".status-text");
+    if (status && text.textContent !== status) {
+        text.textContent = status;
     }
 }
 
 export function updateSessionBranch(branch) {
-    const el = document.getElementById("session-branch");
+    const el = headerNode("session-branch", "");
     if (branch) {
-        el.querySelector(".branch-text").textContent = branch;
+        const text = headerNode("session-branch", ".branch-text");
+        if (text.textContent !== branch) text.textContent = branch;
         el.style.display = "";
     } else {
         el.style.display = "none";
@@ -1134,29 +1159,38 @@ export function updateSessionBranch(branch) {
 }
 
 export function updateWaitingIndicator(s) {
-    const dot = document.getElementById("session-status-dot");
-    const banner = document.getElementById("waiting-banner");
+    const dot = headerNode("session-status-dot", "");
+    const banner = headerNode("waiting-banner", "");
     if (dot) {
-        dot.classList.toggle("waiting", !!s.waiting_for_input);
-        dot.classList.toggle("stuck", !!s.stuck);
-        dot.classList.toggle("working", !!s.working);
-        dot.classList.toggle("done", !!s.done);
+        // Called on every websocket tick: touch the classes only when the
+        // state changes, and then set all four in one pass.
+        const stateKey = [s.waiting_for_input, s.stuck, s.working, s.done].map(Boolean).join();
+        if (dot.dataset.stateKey !== stateKey) {
+            dot.dataset.stateKey = stateKey;
+            dot.classList.toggle("waiting", !!s.waiting_for_input);
+            dot.classList.toggle("stuck", !!s.stuck);
+            dot.classList.toggle("working", !!s.working);
+            dot.classList.toggle("done", !!s.done);
+        }
     }
     if (banner) {
         // Only show banner for needs-input state
-        banner.style.display = s.waiting_for_input ? "" : "none";
+        const display = s.waiting_for_input ? "" : "none";
+        if (banner.style.display !== display) banner.style.display = display;
         if (s.waiting_for_input) {
-            banner.className = "waiting-banner";
-            banner.textContent = "⏳ Agent is waiting for input";
+            const text = "⏳ Agent is waiting for input";
+            if (banner.className !== "waiting-banner") banner.className = "waiting-banner";
+            if (banner.textContent !== text) banner.textContent = text;
         }
     }
 }
 
 export function updateSessionSummary(summary) {
-    const el = document.getElementById("session-summary");
+    const el = headerNode("session-summary", "");
     if (!el) return;
     if (summary) {
-        el.querySelector(".summary-text").textContent = summary;
+        const text = headerNode("session-summary", ".summary-text");
+        if (text.textContent !== summary) text.textContent = summary;
         el.style.display = "";
     }
     // Don't hide — a null summary from a WebSocket tick shouldn't
@@ -7,6 +7,18 @@ import { updateChangedFileCount } from './changed_files.js';
 import { updateSectionVisibility } from './sidebar.js';
 import { showNotificationToast, showToast, escapeHtml } from './utils.js';
 
+// Back-to-back updates within this window share one sidebar render
+const SESSION_RENDER_THROTTLE_MS = 50;
+let sessionRenderTimer = null;
+
+function scheduleSessionListRender() {
+    if (sessionRenderTimer) return;
+    sessionRenderTimer = setTimeout(() => {
+        sessionRenderTimer = null;
+        renderLiveSessions(state.liveSessions);
+    }, SESSION_RENDER_THROTTLE_MS);
+}
+
 export function connectCoralWs() {
     const proto = location.protocol === "https:" ? "wss:" : "ws:";
     const url = `${proto}//${location.host}/ws/coral`;
@@ -91,7 +103,7 @@ export function connectCoralWs() {
                 }
             }
             state.liveSessions = data.sessions;
-            renderLiveSessions(data.sessions);
+            scheduleSessionListRender();
 
             // Update Jobs sidebar
             if (data.active_runs) {
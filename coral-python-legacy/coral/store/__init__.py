@@ -9,7 +9,6 @@ from __future__ import annotations
 
 import functools
 from pathlib import Path
-from typing import Any
 
 from coral.store.connection import DatabaseManager, DB_PATH, get_db_path
 from coral.store.sessions import SessionStore
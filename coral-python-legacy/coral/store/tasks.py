@@ -194,12 +194,13 @@ class TaskStore(DatabaseManager):
     async def reorder_agent_tasks(self, agent_name: str, task_ids: list[int]) -> None:
         now = datetime.now(timezone.utc).isoformat()
         conn = await self._get_conn()
-        for idx, tid in enumerate(task_ids):
-            await conn.execute(
-                "UPDATE agent_tasks SET sort_order = ?, updated_at = ? "
-                "WHERE id = ? AND agent_name = ?",
-                (idx, now, tid, agent_name),
-            )
+        # One executemany: a drag-reorder costs one round trip to the DB
+        # thread instead of one per task in the list.
+        await conn.executemany(
+            "UPDATE agent_tasks SET sort_order = ?, updated_at = ? "
+            "WHERE id = ? AND agent_name = ?",
+            [(idx, now, tid, agent_name) for idx, tid in enumerate(task_ids)],
+        )
         await conn.commit()
 
     # ── Agent Notes ────────────────────────────────────────────────────────
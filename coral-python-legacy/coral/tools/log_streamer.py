@@ -2,43 +2,57 @@
 
 from __future__ import annotations
 
-import asyncio
+import os
 import re
+import threading
 import time
+from collections import deque
 from pathlib import Path
-from typing import Any, AsyncGenerator
+from typing import Any
 
 from coral.tools.session_manager import (
-    STATUS_RE,
-    SUMMARY_RE,
+    _CONTROL_CHAR_RE,
     strip_ansi,
     clean_match,
+    _LogTailState,
+    _advance_log_tail,
+    _last_pulse,
+    _log_tail_view,
     _rejoin_pulse_lines,
+    _status_finditer,
+    _strip_ansi_lines,
+    _summary_finditer,
 )
 
-# Lines that are purely TUI chrome / noise after ANSI stripping
-_BOX_LINE_RE = re.compile(r"^[\s─━═╌╍┄┅┈┉╴╶╸╺─]+$")
-_SPINNER_RE = re.compile(
-    r"^[\s✶✷✸✹✺✻✼✽✾✿⏺⏵⏴⏹⏏⚡●○◉◎◌◐◑◒◓▪▫▸▹►▻\u2800-\u28FF·•]*$"
+# Lines that are purely TUI chrome / noise after ANSI stripping, as one
+# anchored alternation so each line costs a single match() call.
+_NOISE_LINE_RE = re.compile(
+    r"[\s─━═╌╍┄┅┈┉╴╶╸╺─]+$"                                 # Box-drawing / horizontal rules
+    r"|[\s✶✷✸✹✺✻✼✽✾✿⏺⏵⏴⏹⏏⚡●○◉◎◌◐◑◒◓▪▫▸▹►▻\u2800-\u28FF·•]*$"  # Spinner-only lines
+    r"|\s*[❯›>$#%]\s*$"                                       # Bare prompt characters
+    # OSC title sequence fragments that survive ANSI stripping
+    # (e.g., "0;⠐ Real-time Output Streaming" from split \x1b]0;...\x07)
+    r"|\d+;"
+    # Bare numbers with optional decorators (progress counters / step numbers)
+    # Matches: "2", "·  3", "  5 ", "· 12"
+    r"|[·•.\s]*\d+[·•.\s]*$"
 )
+
+# Status bar fragments, searched anywhere in a line
 _STATUS_BAR_RE = re.compile(
     r"(worktree:|branch:|model:|ctx:|in:\d|out:\d|cache:\d|shift\+tab|accept edits)"
 )
-_PROMPT_RE = re.compile(r"^\s*[❯›>$#%]\s*$")
-
-# OSC title sequence fragments that survive ANSI stripping
-# (e.g., "0;⠐ Real-time Output Streaming" from split \x1b]0;...\x07)
-_OSC_TITLE_RE = re.compile(r"^\d+;")
-
-# Bare numbers with optional decorators (progress counters / step numbers)
-# Matches: "2", "·  3", "  5 ", "· 12"
-_BARE_NUMBER_RE = re.compile(r"^[·•.\s]*\d+[·•.\s]*$")
 
-# Known TUI chrome / status labels that leak from terminal UI
+# Known TUI chrome / status labels that leak from terminal UI.  Kept apart
+# from _STATUS_BAR_RE: a case-insensitive branch in one alternation makes
+# re try every branch at each position, which is slower than two searches.
 _TUI_NOISE_RE = re.compile(
     r"Real-time Output Streaming|Streaming response",
     re.IGNORECASE,
 )
+_noise_line_match = _NOISE_LINE_RE.match
+_status_bar_search = _STATUS_BAR_RE.search
+_tui_noise_search = _TUI_NOISE_RE.search
 
 
 def _is_noise_line(line: str) -> bool:
@@ -49,45 +63,136 @@ def _is_noise_line(line: str) -> bool:
     if not stripped:
         return True
 
-    # Box-drawing / horizontal rules
-    if _BOX_LINE_RE.match(stripped):
+    # Very short lines that are just punctuation/symbols (single stray chars)
+    if len(stripped) <= 2 and not stripped.isalnum():
         return True
 
-    # Spinner-only lines
-    if _SPINNER_RE.match(stripped):
-        return True
+    return bool(
+        _noise_line_match(stripped)
+        or _status_bar_search(stripped)
+        or _tui_noise_search(stripped)
+    )
 
-    # Status bar fragments
-    if _STATUS_BAR_RE.search(stripped):
-        return True
 
-    # Bare prompt characters
-    if _PROMPT_RE.match(stripped):
-        return True
+def _is_content_line(line: str) -> bool:
+    return not _is_noise_line(line)
 
-    # Very short lines that are just punctuation/symbols (single stray chars)
-    if len(stripped) <= 2 and not stripped.isalnum():
-        return True
 
-    # OSC title sequence fragments (e.g., "0;⠐ Real-time Output Streaming")
-    if _OSC_TITLE_RE.match(stripped):
-        return True
+# Cache for get_log_snapshot: skips all work when the log is unchanged.
+# Key: (str(log_path), max_lines), Value: (mtime, file_size, result_dict)
+_snapshot_cache: dict[tuple[str, int], tuple[float, int, dict[str, Any]]] = {}
 
-    # Bare numbers / progress counters (e.g., "2", "·  3")
-    if _BARE_NUMBER_RE.match(stripped):
-        return True
+# Incremental tail per snapshot, so a grown log only strips and parses the
+# appended bytes.  Key: (str(log_path), max_lines)
+_snapshot_tails: dict[tuple[str, int], _LogTailState] = {}
+# get_log_snapshot runs in worker threads; concurrent requests for the same
+# session must not advance one tail state at the same time.
+_snapshot_lock = threading.Lock()
 
-    # Known TUI chrome text that leaks from terminal title / status bar
-    if _TUI_NOISE_RE.search(stripped):
-        return True
 
-    return False
+def _scan_backward(
+    f, end: int, result: dict[str, Any], max_lines: int, chunk_size: int,
+) -> list[str]:
+    """Read backwards from byte *end* to fill a missing status/summary.
+
+    Also collects up to *max_lines* older content lines (newest first).
+    Updates *result* in place.
+    """
+    pos = end
+    older: list[str] = []
+    leftover = b""
+
+    max_chunks = 1000  # Up to ~8MB backwards
+    chunks_read = 0
+
+    # Read backwards in chunks
+    while pos > 0 and (len(older) < max_lines or result["status"] is None or result["summary"] is None):
+        if chunks_read >= max_chunks:
+            break
+
+        read_size = min(chunk_size, pos)
+        pos -= read_size
+        f.seek(pos)
+        chunk = f.read(read_size) + leftover
+
+        # The first line might be incomplete, carry it over to the next loop
+        if pos > 0:
+            leftover, sep, chunk = chunk.partition(b"\n")
+            if not sep:
+                chunks_read += 1
+                continue
+
+        # Decode, strip ANSI, and rejoin split PULSE tags
+        clean_parts = _rejoin_pulse_lines(_strip_ansi_lines(chunk))
+
+        for clean_line in reversed(clean_parts):
+            need_status = result["status"] is None
+            need_summary = result["summary"] is None
+            need_lines = len(older) < max_lines
+
+            if not (need_status or need_summary or need_lines):
+                break
+
+            # Only the last tag on a line matters, so walk the matches
+            # instead of building a list of every payload
+            if need_status:
+                result["status"] = _last_pulse(_status_finditer, clean_line)
+
+            if need_summary:
+                result["summary"] = _last_pulse(_summary_finditer, clean_line)
+
+            if need_lines and not _is_noise_line(clean_line):
+                older.append(clean_line)
+
+        chunks_read += 1
+
+    # Fallback for summary: if not found in the tail, it might be at the very top
+    if result["summary"] is None:
+        f.seek(0)
+        head_chunk = f.read(16384).decode("utf-8", errors="replace")
+        # Tags are emitted as plain text, so match the raw chunk and strip
+        # escapes from the short payload; only strip the whole chunk when
+        # an escape sequence or stray control character (both covered by
+        # _CONTROL_CHAR_RE, which strip_ansi removes) may be splitting a tag.
+        last = None
+        for last in _summary_finditer(head_chunk):
+            pass
+        if last is None and _CONTROL_CHAR_RE.search(head_chunk):
+            for last in _summary_finditer(strip_ansi(head_chunk)):
+                pass
+        if last is not None:
+            result["summary"] = clean_match(strip_ansi(last.group(1)))
+
+    return older
+
+
+def release_snapshot_tails(live_log_paths: set[str]) -> None:
+    """Forget snapshot tails and cached snapshots for logs not in *live_log_paths*."""
+    with _snapshot_lock:
+        for key in [k for k in _snapshot_tails if k[0] not in live_log_paths]:
+            del _snapshot_tails[key]
+        for key in [k for k in _snapshot_cache if k[0] not in live_log_paths]:
+            del _snapshot_cache[key]
+
+
+def _cached_snapshot(cache_key: tuple[str, int], stat: os.stat_result) -> dict[str, Any] | None:
+    """Return the cached snapshot for *cache_key* if *stat* still matches it."""
+    cached = _snapshot_cache.get(cache_key)
+    if cached and cached[0] == stat.st_mtime and cached[1] == stat.st_size:
+        cached_result = cached[2].copy()
+        cached_result["staleness_seconds"] = time.time() - stat.st_mtime
+        return cached_result
+    return None
 
 
 def get_log_snapshot(log_path: str | Path, max_lines: int = 200, chunk_size: int = 8192) -> dict[str, Any]:
-    """Return a snapshot of the current log state, reading backwards for efficiency.
+    """Return a snapshot of the current log state.
 
     Returns dict with: status, summary, recent_lines, staleness_seconds.
+    Uses an mtime+size cache so an idle log costs a single ``stat()``, and
+    an incremental tail so a grown log only parses the appended bytes.
+    The first read of a large log parses the tail window and reads
+    backwards from there only for whatever it is still missing.
     """
     log_path = Path(log_path)
     result: dict[str, Any] = {
@@ -97,79 +202,67 @@ def get_log_snapshot(log_path: str | Path, max_lines: int = 200, chunk_size: int
         "staleness_seconds": None,
     }
 
-    if not log_path.exists():
+    cache_key = (str(log_path), max_lines)
+    try:
+        stat = log_path.stat()
+    except OSError:
+        _snapshot_tails.pop(cache_key, None)
         return result
 
-    try:
-        result["staleness_seconds"] = time.time() - log_path.stat().st_mtime
-
-        with open(log_path, "rb") as f:
-            f.seek(0, 2)
-            file_size = f.tell()
-            pos = file_size
-            lines = []
-            leftover = b""
-
-            max_chunks = 1000  # Up to ~8MB backwards
-            chunks_read = 0
-
-            # Read backwards in chunks
-            while pos > 0 and (len(lines) < max_lines or result["status"] is None or result["summary"] is None):
-                if chunks_read >= max_chunks:
-                    break
-
-                read_size = min(chunk_size, pos)
-                pos -= read_size
-                f.seek(pos)
-                chunk = f.read(read_size) + leftover
-
-                parts = chunk.split(b"\n")
-                # The first part might be incomplete, carry it over to the next loop
-                if pos > 0:
-                    leftover = parts.pop(0)
-
-                # Decode, strip ANSI, and rejoin split PULSE tags
-                clean_parts = []
-                for p in parts:
-                    try:
-                        clean_parts.append(strip_ansi(p.decode("utf-8", errors="replace")))
-                    except Exception:
-                        clean_parts.append("")
-                clean_parts = _rejoin_pulse_lines(clean_parts)
-
-                for clean_line in reversed(clean_parts):
-                    need_status = result["status"] is None
-                    need_summary = result["summary"] is None
-                    need_lines = len(lines) < max_lines
-
-                    if not (need_status or need_summary or need_lines):
+    cached_result = _cached_snapshot(cache_key, stat)
+    if cached_result is not None:
+        return cached_result
+
+    with _snapshot_lock:
+        try:
+            # Re-stat under the lock so a stat that predates another
+            # thread's read can't pass for a truncation and reset the tail
+            stat = log_path.stat()
+            cached_result = _cached_snapshot(cache_key, stat)
+            if cached_result is not None:
+                return cached_result
+            result["staleness_seconds"] = time.time() - stat.st_mtime
+
+            state = _snapshot_tails.get(cache_key)
+            fresh = state is None or stat.st_size < state.offset or stat.st_ino != state.ino
+            if fresh:
+                state = _LogTailState(
+                    ino=stat.st_ino,
+                    recent_lines=deque(maxlen=max_lines),
+                    collect_events=False,
+                    keep_line=_is_content_line,
+                )
+                _snapshot_tails[cache_key] = state
+            try:
+                _advance_log_tail(log_path, state, stat.st_size)
+            finally:
+                # Snapshots are polled only while a session is open; don't hold the fd
+                if state.fd is not None:
+                    os.close(state.fd)
+                    state.fd = None
+                state.buf = None
+            result["status"], result["summary"], lines = _log_tail_view(state)
+
+            if fresh and state.origin > 0 and (
+                len(lines) < max_lines or result["status"] is None or result["summary"] is None
+            ):
+                with open(log_path, "rb") as f:
+                    older = _scan_backward(f, state.origin, result, max_lines - len(lines), chunk_size)
+                # Seed the tail so later reads keep what the backward scan found
+                if state.status is None:
+                    state.status = result["status"]
+                if state.summary is None:
+                    state.summary = result["summary"]
+                for line in older:
+                    if len(state.recent_lines) == max_lines:
                         break
+                    state.recent_lines.appendleft(line)
+                older.reverse()
+                lines = (older + lines)[-max_lines:]
 
-                    if need_status:
-                        status_matches = STATUS_RE.findall(clean_line)
-                        if status_matches:
-                            result["status"] = clean_match(status_matches[-1])
-
-                    if need_summary:
-                        summary_matches = SUMMARY_RE.findall(clean_line)
-                        if summary_matches:
-                            result["summary"] = clean_match(summary_matches[-1])
-
-                    if need_lines and not _is_noise_line(clean_line):
-                        lines.insert(0, clean_line)
-                
-                chunks_read += 1
-                
-            # Fallback for summary: if not found in the tail, it might be at the very top
-            if result["summary"] is None:
-                f.seek(0)
-                head_chunk = f.read(16384).decode("utf-8", errors="replace")
-                head_matches = SUMMARY_RE.findall(strip_ansi(head_chunk))
-                if head_matches:
-                    result["summary"] = clean_match(head_matches[-1])
-                        
             result["recent_lines"] = lines
-    except OSError:
-        pass
+            _snapshot_cache[cache_key] = (stat.st_mtime, stat.st_size, result)
+        except OSError:
+            _snapshot_tails.pop(cache_key, None)
 
     return result
@@ -6,14 +6,15 @@ import asyncio
 import logging
 import os
 import re
+import threading
 import time
 import uuid as _uuid
+from collections import deque
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Any
+from typing import Any, Callable, Iterator
 
-import json as _json_mod
-
-from coral.tools.utils import run_cmd, LOG_DIR, LOG_PATTERN, get_package_dir
+from coral.tools.utils import run_cmd, LOG_DIR, get_package_dir, write_json_atomic
 
 ANSI_RE = re.compile(
     r"\x1B(?:"
@@ -22,9 +23,44 @@ ANSI_RE = re.compile(
     r"|[@-Z\\-_]"                         # Fe sequences (ESC + single char)
     r")"
 )
+# Byte-level ANSI_RE for stripping many lines in one pass before decoding.
+# The OSC body also stops at a newline, so a multi-line buffer is stripped
+# exactly as strip_ansi would strip each line on its own.
+_ANSI_BYTES_RE = re.compile(
+    rb"\x1B(?:"
+    rb"\][^\x07\x1B\n]*(?:\x07|\x1B\\)?"
+    rb"|\[[0-?]*[ -/]*[@-~]"
+    rb"|[@-Z\\-_]"
+    rb")"
+)
 _CONTROL_CHAR_RE = re.compile(r"[\x00-\x08\x0b\x0c\x0e-\x1f\x7f]")
-STATUS_RE = re.compile(r"\|\|PULSE:STATUS (.*?)\|\|")
-SUMMARY_RE = re.compile(r"\|\|PULSE:SUMMARY (.*?)\|\|")
+# PULSE payload up to the first "||": runs of non-pipe characters, each
+# single "|" followed by at least one more.  Same matches as a lazy
+# ``(.*?)\|\|`` but without re-testing the closer after every character.
+_PULSE_PAYLOAD = r"([^|\n]*(?:\|[^|\n]+)*)\|\|"
+STATUS_RE = re.compile(r"\|\|PULSE:STATUS " + _PULSE_PAYLOAD)
+SUMMARY_RE = re.compile(r"\|\|PULSE:SUMMARY " + _PULSE_PAYLOAD)
+# Only match known PULSE event types to avoid matching protocol documentation examples
+KNOWN_PULSE_TYPES = ("STATUS", "SUMMARY", "CONFIDENCE")
+# Event payloads may span lines
+PULSE_EVENT_RE = re.compile(
+    r"\|\|PULSE:(" + "|".join(KNOWN_PULSE_TYPES) + r")\s+([^|]*(?:\|[^|]+)*)\|\|"
+)
+# Activity events (every type but STATUS/SUMMARY) in raw log bytes, for the
+# output a burst read in _advance_log_tail skips over
+_PULSE_ACTIVITY_BYTES_RE = re.compile(
+    rb"\|\|PULSE:("
+    + "|".join(t for t in KNOWN_PULSE_TYPES if t not in ("STATUS", "SUMMARY")).encode()
+    + rb")\s+([^|]*(?:\|[^|]+)*)\|\|"
+)
+# Bound methods for the per-line and per-poll hot paths, so each call skips
+# the global + attribute lookup on the compiled pattern.
+_ansi_sub = ANSI_RE.sub
+_ansi_bytes_sub = _ANSI_BYTES_RE.sub
+_control_char_sub = _CONTROL_CHAR_RE.sub
+_status_finditer = STATUS_RE.finditer
+_summary_finditer = SUMMARY_RE.finditer
+_pulse_activity_bytes_finditer = _PULSE_ACTIVITY_BYTES_RE.finditer
 
 # Regex to parse new-format tmux session names: {agent_type}-{uuid}
 _UUID_RE = re.compile(
@@ -75,7 +111,7 @@ def _write_board_state(tmux_session_name: str, project: str, job_title: str,
     }
     if server_url:
         data["server_url"] = server_url.rstrip("/")
-    state_file.write_text(_json_mod.dumps(data))
+    write_json_atomic(state_file, data)
 
 
 async def setup_board_and_prompt(
@@ -124,12 +160,28 @@ async def setup_board_and_prompt(
 
 def strip_ansi(text: str) -> str:
     """Remove ANSI escape sequences, replacing each with a space."""
-    text = ANSI_RE.sub(" ", text)
+    # Most lines carry no ESC or control characters at all; isprintable()
+    # rules both out in one C-level pass, skipping the two regex scans.
+    if text.isprintable():
+        return text
+    text = _ansi_sub(" ", text)
     # Remove stray control characters (BEL \x07, etc.) left after partial sequences
-    text = _CONTROL_CHAR_RE.sub("", text)
+    text = _control_char_sub("", text)
     return text
 
 
+def _strip_ansi_lines(data: bytes) -> list[str]:
+    """Decode newline-separated *data* into lines with ANSI sequences stripped.
+
+    Equivalent to ``strip_ansi`` on each decoded line, but runs one regex
+    pass and one decode over the whole buffer instead of one per line.
+    """
+    if b"\x1b" in data:
+        data = _ansi_bytes_sub(b" ", data)
+    text = _control_char_sub("", data.decode("utf-8", errors="replace"))
+    return text.split("\n")
+
+
 def clean_match(text: str) -> str:
     """Collapse whitespace runs into a single space and strip.
 
@@ -143,6 +195,9 @@ def clean_match(text: str) -> str:
     return cleaned
 
 
+_MAX_PULSE_JOIN = 5  # Continuation lines merged into one wrapped PULSE tag
+
+
 def _rejoin_pulse_lines(lines: list[str]) -> list[str]:
     """Rejoin lines where ``||PULSE:...||`` tags were split by terminal wrapping.
 
@@ -154,9 +209,8 @@ def _rejoin_pulse_lines(lines: list[str]) -> list[str]:
 
     This function detects an opening ``||PULSE:`` without a closing ``||`` on
     the same line and merges subsequent lines until the closing ``||`` is found
-    (up to *MAX_JOIN* continuation lines as a safety limit).
+    (up to *_MAX_PULSE_JOIN* continuation lines as a safety limit).
     """
-    MAX_JOIN = 5
     result: list[str] = []
     pending: str | None = None
     depth = 0
@@ -166,7 +220,7 @@ def _rejoin_pulse_lines(lines: list[str]) -> list[str]:
             # Accumulating continuation of a split PULSE tag
             pending = pending + " " + line.strip()
             depth += 1
-            if "||" in line or depth >= MAX_JOIN:
+            if "||" in line or depth >= _MAX_PULSE_JOIN:
                 result.append(pending)
                 pending = None
                 depth = 0
@@ -198,7 +252,6 @@ async def discover_coral_agents() -> list[dict[str, Any]]:
     or falls back to old agent-N naming. Derives agent_name from the
     pane's working directory.
     """
-    from glob import glob
     from coral.tools.tmux_manager import list_tmux_sessions
 
     panes = await list_tmux_sessions()
@@ -235,16 +288,83 @@ async def discover_coral_agents() -> list[dict[str, Any]]:
     # Only delete files older than 5 minutes to avoid race conditions
     # where a session was just launched but not yet discovered.
     live_log_paths = {r["log_path"] for r in results}
-    for log_path in glob(LOG_PATTERN):
+    release_log_tails(live_log_paths)
+    _sweep_stale_logs(live_log_paths)
+
+    return sorted(results, key=lambda r: r["agent_name"])
+
+
+_STALE_LOG_AGE_S = 300
+# Last stale-log sweep: (listing, live log paths, time the next sweep is due).
+# _list_coral_logs hands back the same list object while LOG_DIR is
+# unchanged, so an identical listing and live set need no new sweep until a
+# young orphan log can have aged past _STALE_LOG_AGE_S.
+_last_log_sweep: tuple[list[tuple[str, str, str]], frozenset[str], float] | None = None
+
+
+def _sweep_stale_logs(live_log_paths: set[str]) -> None:
+    """Delete orphaned coral logs older than _STALE_LOG_AGE_S."""
+    global _last_log_sweep
+    logs = _list_coral_logs()
+    live_key = frozenset(live_log_paths)
+    now = time.time()
+    last = _last_log_sweep
+    if last and last[0] is logs and last[1] == live_key and now < last[2]:
+        return
+
+    next_due = float("inf")
+    for _, _, log_path in logs:
         if log_path not in live_log_paths:
             try:
-                age = time.time() - Path(log_path).stat().st_mtime
-                if age > 300:  # Only delete if older than 5 minutes
-                    Path(log_path).unlink()
+                mtime = os.stat(log_path).st_mtime
+                if now - mtime > _STALE_LOG_AGE_S:
+                    os.unlink(log_path)
+                else:
+                    next_due = min(next_due, mtime + _STALE_LOG_AGE_S)
             except OSError:
                 pass
+    _last_log_sweep = (logs, live_key, next_due)
+
+
+# Cache for _list_coral_logs, invalidated by the log directory's mtime.
+# Key: LOG_DIR, Value: (dir_mtime_ns, listing)
+_coral_logs_cache: dict[str, tuple[int, list[tuple[str, str, str]]]] = {}
 
-    return sorted(results, key=lambda r: r["agent_name"])
+
+def _list_coral_logs() -> list[tuple[str, str, str]]:
+    """Return ``(agent_type, name, path)`` for every ``*_coral_*.log`` in LOG_DIR.
+
+    *name* is the part after ``_coral_`` (a session_id, or an agent name for
+    old-style logs).  Uses one scandir pass with plain string checks rather
+    than glob plus a regex per file, and reuses the previous listing while
+    the directory's mtime is unchanged.
+    """
+    try:
+        dir_mtime = os.stat(LOG_DIR).st_mtime_ns
+    except OSError:
+        return []
+    cached = _coral_logs_cache.get(LOG_DIR)
+    if cached and cached[0] == dir_mtime:
+        return cached[1]
+
+    results = []
+    try:
+        with os.scandir(LOG_DIR) as it:
+            for entry in it:
+                fname = entry.name
+                if fname.startswith(".") or not fname.endswith(".log"):
+                    continue
+                prefix, sep, name = fname[:-4].partition("_coral_")
+                agent_type = prefix.rsplit("_", 1)[-1]
+                if sep and agent_type and name:
+                    results.append((agent_type, name, entry.path))
+    except OSError:
+        return results
+    # On coarse-timestamp filesystems a directory touched within the last
+    # second can change again without a visible mtime bump — don't cache yet.
+    if time.time_ns() - dir_mtime > 1_000_000_000:
+        _coral_logs_cache[LOG_DIR] = (dir_mtime, results)
+    return results
 
 
 def get_agent_log_path(
@@ -255,8 +375,6 @@ def get_agent_log_path(
     When *session_id* is provided, looks for ``{type}_coral_{session_id}.log``
     first. Falls back to matching by agent_name.
     """
-    from glob import glob
-
     # Fast path: session_id-based log file
     if session_id:
         if agent_type:
@@ -264,19 +382,18 @@ def get_agent_log_path(
             if p.exists():
                 return p
         # Try any type prefix
-        for log_path in glob(os.path.join(LOG_DIR, f"*_coral_{session_id}.log")):
-            return Path(log_path)
+        for _log_type, name, log_path in _list_coral_logs():
+            if name == session_id:
+                return Path(log_path)
 
     # Fallback: match by agent_name
     best: Path | None = None
-    for log_path in glob(LOG_PATTERN):
-        p = Path(log_path)
-        match = re.search(r"([^_]+)_coral_(.+)", p.stem)
-        if match and match.group(2) == agent_name:
-            if agent_type and match.group(1).lower() == agent_type.lower():
-                return p
+    for log_type, name, log_path in _list_coral_logs():
+        if name == agent_name:
+            if agent_type and log_type.lower() == agent_type.lower():
+                return Path(log_path)
             if best is None:
-                best = p
+                best = Path(log_path)
     return best
 
 
@@ -284,11 +401,272 @@ def get_agent_log_path(
 # Key: str(log_path), Value: (mtime, file_size, result_dict)
 _log_status_cache: dict[str, tuple[float, int, dict[str, Any]]] = {}
 
+_TAIL_BYTES = 256_000   # Initial read window (≈1000 lines) for a newly seen log
+_TAIL_BUF = 65536       # Per-log read buffer kept for typical appends
+_RECENT_LINES = 20      # Lines kept for the session list preview
+_PENDING_EVENTS = 100   # Cap on parsed activity events awaiting scan_log_for_pulse_events
+_SKIP_SCAN_CHUNK = 1 << 20  # Read size when scanning skipped output for events
+
+
+@dataclass
+class _LogTailState:
+    """Incremental parse state for one agent log file."""
+    offset: int = 0
+    # Inode the offset refers to; a replaced log (same path, new file) restarts the tail
+    ino: int = 0
+    # Read-only fd kept open between polls so each one is a single pread
+    fd: int | None = None
+    # Reused read buffer; appends larger than _TAIL_BUF use a one-off buffer
+    buf: bytearray | None = None
+    # Bytes after the last newline — an unterminated line still being written
+    residual: bytes = b""
+    # Clean lines of a wrapped PULSE tag still waiting for its closing ``||``
+    pending: list[str] = field(default_factory=list)
+    status: str | None = None
+    summary: str | None = None
+    recent_lines: deque[str] = field(default_factory=lambda: deque(maxlen=_RECENT_LINES))
+    # (event_type, payload) activity events not yet drained by the pulse
+    # detector; the oldest fall off once _PENDING_EVENTS are waiting
+    events: deque[tuple[str, str]] = field(default_factory=lambda: deque(maxlen=_PENDING_EVENTS))
+    collect_events: bool = True
+    # Predicate for lines worth keeping in recent_lines (None keeps all)
+    keep_line: Callable[[str], bool] | None = None
+    # Byte offset where parsed content begins (after a skipped partial line)
+    origin: int = 0
+
+
+# Key: str(log_path), Value: tail state advanced by get_log_status
+_log_tail_state: dict[str, _LogTailState] = {}
+# Serialises tail updates: get_log_statuses runs in a worker thread while
+# other callers may advance the same state from the event loop.
+_log_tail_lock = threading.Lock()
+
+
+def _drop_log_tail(key: str) -> None:
+    """Forget the tail state for *key* and close its fd."""
+    state = _log_tail_state.pop(key, None)
+    if state is not None and state.fd is not None:
+        try:
+            os.close(state.fd)
+        except OSError:
+            pass
+
+
+def release_log_tails(live_log_paths: set[str]) -> None:
+    """Close tail fds and drop cached state for logs no longer belonging to a live agent."""
+    from coral.tools.log_streamer import release_snapshot_tails
+
+    with _log_tail_lock:
+        for key in [k for k in _log_tail_state if k not in live_log_paths]:
+            _drop_log_tail(key)
+            _log_status_cache.pop(key, None)
+    release_snapshot_tails(live_log_paths)
+
+
+def drain_log_events(log_path: str | Path) -> list[tuple[str, str]]:
+    """Take the ``(event_type, payload)`` activity events queued for *log_path*.
+
+    Events are queued by get_log_status's tail reads; this never reads the
+    log itself, so it is safe to call from the event loop.
+    """
+    with _log_tail_lock:
+        state = _log_tail_state.get(str(Path(log_path)))
+        if state is None or not state.events:
+            return []
+        events = list(state.events)
+        state.events.clear()
+    return events
+
+
+def _split_open_pulse(lines: list[str]) -> tuple[list[str], list[str]]:
+    """Split off trailing lines that belong to a PULSE tag not yet closed.
+
+    Returns ``(complete_lines, open_lines)``.  The open lines are held back
+    so the tag can be rejoined once its continuation arrives in a later read.
+    Follows the same state machine as _rejoin_pulse_lines, so the held-back
+    chain starts at its first opener, not at a later ``||PULSE:`` that is
+    itself a continuation line.
+    """
+    open_at = -1
+    depth = 0
+    for i, line in enumerate(lines):
+        if open_at != -1:
+            depth += 1
+            if "||" in line or depth >= _MAX_PULSE_JOIN:
+                open_at = -1
+        elif "||PULSE:" in line:
+            idx = line.rfind("||PULSE:")
+            if "||" not in line[idx + len("||PULSE:"):]:
+                open_at = i
+                depth = 0
+    if open_at == -1:
+        return lines, []
+    return lines[:open_at], lines[open_at:]
+
+
+def _last_pulse(finditer: Callable[[str], Iterator[re.Match[str]]], text: str) -> str | None:
+    """Return the cleaned payload of the last *finditer* match in *text*, or None."""
+    last = None
+    for last in finditer(text):
+        pass
+    return clean_match(last.group(1)) if last else None
+
+
+def _scan_status_summary(lines: list[str]) -> tuple[str | None, str | None]:
+    """Return the latest (status, summary) found in *lines*, or None for each if absent."""
+    # STATUS_RE/SUMMARY_RE never cross a newline, so one pass over the joined
+    # text matches the same tags as scanning line by line.
+    text = "\n".join(lines)
+    return _last_pulse(_status_finditer, text), _last_pulse(_summary_finditer, text)
+
+
+if hasattr(os, "preadv"):
+    def _pread_into(fd: int, view: memoryview, offset: int) -> int:
+        """Read into *view* at *offset* without allocating; return bytes read."""
+        return os.preadv(fd, [view], offset)
+else:  # e.g. macOS before Python 3.11
+    def _pread_into(fd: int, view: memoryview, offset: int) -> int:
+        """Read into *view* at *offset*; return bytes read."""
+        data = os.pread(fd, len(view), offset)
+        view[:len(data)] = data
+        return len(data)
+
+
+def _collect_skipped_events(state: _LogTailState, start: int, end: int) -> None:
+    """Queue the activity events in bytes ``[start, end)`` of the open log.
+
+    Used for output a burst read doesn't parse, so CONFIDENCE and other
+    activity events still reach the pulse detector.  This is one bytes
+    regex pass per chunk; STATUS/SUMMARY only matter from the tail window.
+    """
+    carry = state.residual
+    pos = start
+    while pos < end:
+        chunk = os.pread(state.fd, min(_SKIP_SCAN_CHUNK, end - pos), pos)
+        if not chunk:
+            break
+        pos += len(chunk)
+        data = carry + chunk
+        if b"\x1b" in data:
+            data = _ansi_bytes_sub(b" ", data)
+        last_end = 0
+        for match in _pulse_activity_bytes_finditer(data):
+            payload = clean_match(strip_ansi(match.group(2).decode("utf-8", errors="replace")))
+            if payload:
+                state.events.append((match.group(1).decode().lower(), payload))
+            last_end = match.end()
+        # Keep an unfinished tag (or escape sequence) for the next chunk
+        carry = data[max(last_end, len(data) - 4096):]
+
+
+def _advance_log_tail(log_path: Path, state: _LogTailState, file_size: int) -> None:
+    """Read the bytes appended since ``state.offset`` and fold them into *state*."""
+    if state.fd is None:
+        state.fd = os.open(str(log_path), os.O_RDONLY)
+
+    start = state.offset
+    drop_partial = False
+    if file_size - start > _TAIL_BYTES:
+        # First read of a large log, or more output than the window since the
+        # last poll: only parse the tail window.  Anything skipped over can't
+        # be continued or spliced onto, so the carried-over lines go too;
+        # activity events in the skipped output are still collected.
+        if start:
+            if state.collect_events:
+                _collect_skipped_events(state, start, file_size - _TAIL_BYTES)
+            state.residual = b""
+            state.pending = []
+            state.recent_lines.clear()
+        start = file_size - _TAIL_BYTES
+        drop_partial = True
+
+    # Read straight in after the carried-over partial line, so new bytes
+    # are copied once instead of chunk list -> join -> residual concat.
+    head = len(state.residual)
+    need = head + file_size - start
+    if need <= _TAIL_BUF:
+        if state.buf is None:
+            state.buf = bytearray(_TAIL_BUF)
+        buf = state.buf
+    else:
+        buf = bytearray(need)
+    buf[:head] = state.residual
+    end = head
+    with memoryview(buf) as view:
+        while end < need:
+            n = _pread_into(state.fd, view[end:need], start + end - head)
+            if not n:
+                break
+            end += n
+        data = bytes(view[:end])
+    state.offset = start + end - head
+    if drop_partial:
+        nl = data.find(b"\n")
+        data = data[nl + 1:] if nl != -1 else b""
+        state.origin = state.offset - len(data)
+
+    complete, sep, state.residual = data.rpartition(b"\n")
+    clean_lines = state.pending + (_strip_ansi_lines(complete) if sep else [])
+    clean_lines, state.pending = _split_open_pulse(clean_lines)
+    clean_lines = _rejoin_pulse_lines(clean_lines)
+    if not clean_lines:
+        return
+
+    # Activity events share this read; STATUS and SUMMARY are tracked with
+    # deduplication in live_sessions instead.
+    if state.collect_events:
+        for match in PULSE_EVENT_RE.finditer("\n".join(clean_lines)):
+            event_type = match.group(1)
+            if event_type in ("STATUS", "SUMMARY"):
+                continue
+            payload = clean_match(match.group(2))
+            if payload:
+                state.events.append((event_type.lower(), payload))
+
+    status, summary = _scan_status_summary(clean_lines)
+    if status is not None:
+        state.status = status
+    if summary is not None:
+        state.summary = summary
+    if state.keep_line is None:
+        state.recent_lines.extend(clean_lines)
+    else:
+        state.recent_lines.extend(filter(state.keep_line, clean_lines))
+
+
+def _log_tail_view(state: _LogTailState) -> tuple[str | None, str | None, list[str]]:
+    """Return (status, summary, recent_lines) including the unterminated last line."""
+    tail = list(state.pending)
+    if state.residual:
+        tail.append(strip_ansi(state.residual.decode("utf-8", errors="replace")))
+    if not tail:
+        return state.status, state.summary, list(state.recent_lines)
+    tail = _rejoin_pulse_lines(tail)
+    status, summary = _scan_status_summary(tail)
+    if state.keep_line is not None:
+        tail = [line for line in tail if state.keep_line(line)]
+    return (
+        state.status if status is None else status,
+        state.summary if summary is None else summary,
+        (list(state.recent_lines) + tail)[-state.recent_lines.maxlen:],
+    )
+
+
+def _cached_log_status(cache_key: str, stat: os.stat_result) -> dict[str, Any] | None:
+    """Return the cached get_log_status result if *stat* still matches it."""
+    cached = _log_status_cache.get(cache_key)
+    if cached and cached[0] == stat.st_mtime and cached[1] == stat.st_size:
+        cached_result = cached[2].copy()
+        cached_result["staleness_seconds"] = time.time() - stat.st_mtime
+        return cached_result
+    return None
+
 
 def get_log_status(log_path: str | Path) -> dict[str, Any]:
     """Read a log file and return current status, summary, staleness, and recent lines.
 
     Uses mtime+size cache to skip re-parsing when the file hasn't changed.
+    When the file has grown, only the appended bytes are read and parsed.
     """
     log_path = Path(log_path)
     result: dict[str, Any] = {
@@ -299,66 +677,49 @@ def get_log_status(log_path: str | Path) -> dict[str, Any]:
     }
     try:
         stat = log_path.stat()
-        mtime = stat.st_mtime
-        fsize = stat.st_size
-        result["staleness_seconds"] = time.time() - mtime
-
-        # Check cache: if mtime and size match, return cached result with updated staleness
         cache_key = str(log_path)
-        cached = _log_status_cache.get(cache_key)
-        if cached and cached[0] == mtime and cached[1] == fsize:
-            cached_result = cached[2].copy()
-            cached_result["staleness_seconds"] = result["staleness_seconds"]
+        cached_result = _cached_log_status(cache_key, stat)
+        if cached_result is not None:
             return cached_result
 
-        # Read the last ~1000 lines (≈256KB) from the tail of the file
-        _TAIL_BYTES = 256_000
-        with open(log_path, "rb") as f:
-            f.seek(0, 2)
-            file_size = f.tell()
-            start = max(0, file_size - _TAIL_BYTES)
-            f.seek(start)
-            raw = f.read()
-
-        raw_lines = raw.split(b"\n")
-        if start > 0:
-            raw_lines = raw_lines[1:]  # drop partial first line
-
-        # Decode, strip ANSI, rejoin split PULSE tags
-        clean_lines = []
-        for raw_line in raw_lines:
-            try:
-                clean_lines.append(strip_ansi(raw_line.decode("utf-8", errors="replace")))
-            except Exception:
-                clean_lines.append("")
-        clean_lines = _rejoin_pulse_lines(clean_lines)
-
-        # Walk backwards to find latest status and summary
-        lines = []
-        for clean_line in reversed(clean_lines):
-            if result["status"] is not None and result["summary"] is not None and len(lines) >= 20:
-                break
-
-            if result["status"] is None:
-                status_matches = STATUS_RE.findall(clean_line)
-                if status_matches:
-                    result["status"] = clean_match(status_matches[-1])
-
-            if result["summary"] is None:
-                summary_matches = SUMMARY_RE.findall(clean_line)
-                if summary_matches:
-                    result["summary"] = clean_match(summary_matches[-1])
+        with _log_tail_lock:
+            # Re-stat under the lock: a stat taken while another thread was
+            # advancing this tail can predate its read and look like a
+            # truncation, which would reset the tail and re-queue its events.
+            stat = log_path.stat()
+            cached_result = _cached_log_status(cache_key, stat)
+            if cached_result is not None:
+                return cached_result
+            mtime = stat.st_mtime
+            fsize = stat.st_size
+            result["staleness_seconds"] = time.time() - mtime
+
+            state = _log_tail_state.get(cache_key)
+            if state is None or fsize < state.offset or stat.st_ino != state.ino:
+                # New, truncated or replaced log (e.g. restart) — start over from the tail window
+                _drop_log_tail(cache_key)
+                state = _LogTailState(ino=stat.st_ino)
+                _log_tail_state[cache_key] = state
+            _advance_log_tail(log_path, state, fsize)
+
+            result["status"], result["summary"], result["recent_lines"] = _log_tail_view(state)
+
+            # Update cache
+            _log_status_cache[cache_key] = (mtime, fsize, result)
+    except OSError:
+        # Log removed or unreadable — don't hold its fd open
+        with _log_tail_lock:
+            _drop_log_tail(str(log_path))
+    return result
 
-            if len(lines) < 20:
-                lines.insert(0, clean_line)
 
-        result["recent_lines"] = lines
+def get_log_statuses(log_paths: list[str]) -> list[dict[str, Any]]:
+    """Return get_log_status for each path, in order.
 
-        # Update cache
-        _log_status_cache[cache_key] = (mtime, fsize, result)
-    except OSError:
-        pass
-    return result
+    Lets callers on the event loop hand every agent's log read to one
+    worker thread instead of blocking the loop once per agent.
+    """
+    return [get_log_status(p) for p in log_paths]
 
 
 def load_history_sessions() -> list[dict[str, Any]]:
@@ -582,7 +943,7 @@ async def restart_session(
 
     Returns a dict with result info or an ``error`` key.
     """
-    from coral.tools.tmux_manager import _find_pane
+    from coral.tools.tmux_manager import _find_pane, invalidate_pane_cache
 
     pane = await _find_pane(agent_name, agent_type, session_id=session_id)
     if not pane:
@@ -630,6 +991,7 @@ async def restart_session(
         rc, _, stderr = await run_cmd(
             "tmux", "rename-session", "-t", session_name, new_session_name
         )
+        invalidate_pane_cache()
         if rc != 0:
             return {"error": f"rename-session failed: {stderr}"}
 
@@ -818,6 +1180,8 @@ async def launch_claude_session(working_dir: str, agent_type: str = "claude", di
         if resume_session_id:
             agent_impl.prepare_resume(resume_session_id, working_dir)
 
+    from coral.tools.tmux_manager import invalidate_pane_cache
+
     try:
         # Clear old log
         Path(log_file).write_text("")
@@ -826,6 +1190,7 @@ async def launch_claude_session(working_dir: str, agent_type: str = "claude", di
         rc, _, stderr = await run_cmd(
             "tmux", "new-session", "-d", "-s", session_name, "-c", working_dir
         )
+        invalidate_pane_cache()
         if rc != 0:
             return {"error": f"tmux new-session failed: {stderr}"}
 
@@ -6,6 +6,7 @@ import asyncio
 import os
 import platform
 import shutil
+import time
 from typing import Any
 
 from coral.tools.utils import run_cmd
@@ -29,8 +30,25 @@ async def _send_bracket_pasted(target: str, text: str) -> str | None:
     return None
 
 
+# Parsed `tmux list-panes -a` output shared by every caller for a short TTL,
+# so a burst of sends/captures across agents costs one subprocess.
+# Value: (time.monotonic() of the listing, pane dicts)
+_PANE_CACHE_TTL_S = 2.0
+_pane_cache: tuple[float, list[dict[str, str]]] | None = None
+
+
+def invalidate_pane_cache() -> None:
+    """Drop the cached pane listing after creating, killing or renaming a session."""
+    global _pane_cache
+    _pane_cache = None
+
+
 async def list_tmux_sessions() -> list[dict[str, str]]:
     """List all tmux panes with their titles, session names, and targets."""
+    global _pane_cache
+    cached = _pane_cache
+    if cached is not None and time.monotonic() - cached[0] < _PANE_CACHE_TTL_S:
+        return list(cached[1])
     try:
         rc, stdout, _ = await run_cmd(
             "tmux", "list-panes", "-a",
@@ -49,7 +67,8 @@ async def list_tmux_sessions() -> list[dict[str, str]]:
                     "target": parts[2],
                     "current_path": parts[3],
                 })
-        return results
+        _pane_cache = (time.monotonic(), results)
+        return list(results)
     except (OSError, FileNotFoundError):
         return []
 
@@ -161,7 +180,9 @@ async def send_to_tmux(
             if rc != 0:
                 return f"send-keys failed (rc={rc}): {stderr}"
 
-        # Pause to let tmux deliver keystrokes to the pane
+        # Pause to let tmux deliver keystrokes to the pane. Enter stays a
+        # separate send-keys: TUI agents treat text and Enter arriving in
+        # the same read as a paste and insert a newline instead of submitting.
         await asyncio.sleep(0.3)
 
         # Send Enter
@@ -335,6 +356,7 @@ async def kill_session(
         rc, _, stderr = await run_cmd(
             "tmux", "kill-session", "-t", session_name
         )
+        invalidate_pane_cache()
         if rc != 0:
             return f"kill-session failed: {stderr}"
 
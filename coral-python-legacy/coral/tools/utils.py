@@ -2,11 +2,11 @@
 
 from __future__ import annotations
 
-import asyncio
+import json
 import os
 import subprocess
 from pathlib import Path
-from typing import Tuple
+from typing import Any, Tuple
 
 # Configuration Constants
 import tempfile
@@ -68,6 +68,10 @@ async def run_cmd(*args: str, timeout: float | None = None) -> Tuple[int, str, s
     Returns:
         Tuple of (returncode, stdout, stderr).
     """
+    # Imported here: hooks and CLIs import this module for its paths and
+    # would otherwise pay for loading asyncio on every short-lived run.
+    import asyncio
+
     try:
         proc = await asyncio.create_subprocess_exec(
             *args,
@@ -92,3 +96,19 @@ async def run_cmd(*args: str, timeout: float | None = None) -> Tuple[int, str, s
         return -1, "", "Command timed out"
     except Exception as e:
         return -1, "", str(e)
+
+
+def write_json_atomic(path: Path, data: Any, indent: int | None = None) -> None:
+    """Write *data* as JSON to *path* via a temp file and ``os.replace``.
+
+    Readers (agent CLIs, the dashboard) never see a half-written file.
+    Compact separators are used unless *indent* is given.
+    """
+    text = json.dumps(data, indent=indent, separators=None if indent else (",", ":"))
+    tmp = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+    try:
+        tmp.write_text(text)
+        os.replace(tmp, path)
+    except BaseException:
+        tmp.unlink(missing_ok=True)
+        raise
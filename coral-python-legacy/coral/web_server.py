@@ -160,6 +160,12 @@ async def lifespan(app: FastAPI):
     remote_poller = RemoteBoardPoller(remote_board_store)
     remote_poller_task = asyncio.create_task(remote_poller.run_forever(interval=REMOTE_POLLER_INTERVAL_S))
 
+    # Push session list updates to dashboards as agent logs change
+    from coral.background_tasks import LogWatcher
+    from coral.config import LOG_WATCH_DEBOUNCE_MS
+    log_watcher = LogWatcher(live_sessions_api.notify_sessions_changed)
+    log_watcher_task = asyncio.create_task(log_watcher.run_forever(debounce_ms=LOG_WATCH_DEBOUNCE_MS))
+
     # Start job scheduler
     from coral.background_tasks.scheduler import JobScheduler
     scheduler = JobScheduler(schedule_store)
@@ -211,6 +217,7 @@ async def lifespan(app: FastAPI):
     idle_task.cancel()
     board_notifier_task.cancel()
     remote_poller_task.cancel()
+    log_watcher_task.cancel()
     try:
         await asyncio.wait_for(remote_poller.close(), timeout=5)
     except asyncio.TimeoutError:
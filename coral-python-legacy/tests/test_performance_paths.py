@@ -20,6 +20,8 @@ import pytest_asyncio
 
 from coral.store.connection import DatabaseManager
 from coral.store.git import GitStore
+# Bound at import time: conftest's autouse fixture replaces the module attribute.
+from coral.tools.session_manager import discover_coral_agents as _discover_coral_agents
 
 
 # ── Fixtures ──────────────────────────────────────────────────────────
@@ -309,6 +311,74 @@ def test_get_log_snapshot_summary_at_top():
         os.unlink(log_path)
 
 
+def test_get_log_snapshot_head_summary_strips_only_payload(tmp_path):
+    """The head fallback matches raw text and cleans ANSI codes from the payload."""
+    from coral.tools import session_manager
+    from coral.tools.log_streamer import get_log_snapshot
+
+    filler = ("x" * 100 + "\n") * (session_manager._TAIL_BYTES // 100 + 10)
+    log_path = tmp_path / "claude_coral_head.log"
+    log_path.write_text("\x1b[1m||PULSE:SUMMARY Ship \x1b[32mthe\x1b[0m fix||\n" + filler)
+    assert get_log_snapshot(log_path, max_lines=5)["summary"] == "Ship the fix"
+
+
+def test_scan_backward_head_summary_rescans_after_control_chars(tmp_path):
+    """A bare control character splitting the head tag is stripped before matching."""
+    from coral.tools.log_streamer import _scan_backward
+
+    log_path = tmp_path / "claude_coral_head_bel.log"
+    log_path.write_bytes(b"||PULSE:SUMM\x07ARY Ship the fix||\nmore\n")
+    result = {"status": "Working", "summary": None}
+    with open(log_path, "rb") as f:
+        # end=0: nothing left to read backwards, only the head fallback runs
+        _scan_backward(f, 0, result, 0, 8192)
+    assert result["summary"] == "Ship the fix"
+
+
+def test_get_log_snapshot_skips_read_when_unchanged(tmp_path):
+    """An unchanged log is served from cache; an append triggers a fresh read."""
+    from coral.tools.log_streamer import get_log_snapshot
+
+    log_path = tmp_path / "claude_coral_snap.log"
+    log_path.write_text("||PULSE:STATUS Idle||\n")
+    assert get_log_snapshot(log_path)["status"] == "Idle"
+
+    with patch("coral.tools.log_streamer.open", side_effect=AssertionError("re-read"), create=True):
+        result = get_log_snapshot(log_path)
+    assert result["status"] == "Idle"
+    assert result["staleness_seconds"] is not None
+
+    with open(log_path, "a") as f:
+        f.write("||PULSE:STATUS Busy||\n")
+    assert get_log_snapshot(log_path)["status"] == "Busy"
+
+
+def test_get_log_snapshot_parses_only_appended_bytes(tmp_path):
+    """After the first snapshot of a large log, growth is parsed incrementally."""
+    from coral.tools.log_streamer import get_log_snapshot
+
+    log_path = tmp_path / "claude_coral_bigsnap.log"
+    with open(log_path, "w") as f:
+        f.write("||PULSE:SUMMARY Initial goal||\n")
+        for i in range(4000):
+            f.write(f"Line {i}: " + "x" * 100 + "\n")
+        f.write("||PULSE:STATUS First||\n")
+
+    result = get_log_snapshot(log_path, max_lines=10)
+    assert result["status"] == "First"
+    assert result["summary"] == "Initial goal"
+    assert result["recent_lines"][-2:] == ["Line 3999: " + "x" * 100, "||PULSE:STATUS First||"]
+
+    with open(log_path, "a") as f:
+        f.write("||PULSE:STATUS Second||\nmore output\n")
+    with patch("coral.tools.log_streamer._scan_backward", side_effect=AssertionError("rescanned")):
+        result = get_log_snapshot(log_path, max_lines=10)
+    assert result["status"] == "Second"
+    assert result["summary"] == "Initial goal"
+    assert len(result["recent_lines"]) == 10
+    assert result["recent_lines"][-1] == "more output"
+
+
 # ── get_log_status (session_manager) ──────────────────────────────────
 
 
@@ -331,6 +401,414 @@ def test_get_log_status_basic():
         os.unlink(log_path)
 
 
+def test_get_log_status_reads_only_appended_bytes(tmp_path):
+    """After the first read, appended content updates status without a full re-parse."""
+    from coral.tools.session_manager import get_log_status, _log_tail_state
+
+    log_path = tmp_path / "claude_coral_tail.log"
+    log_path.write_text("||PULSE:STATUS First||\n||PULSE:SUMMARY Goal||\n")
+
+    result = get_log_status(log_path)
+    assert result["status"] == "First"
+    offset = _log_tail_state[str(log_path)].offset
+    assert offset == log_path.stat().st_size
+
+    with open(log_path, "a") as f:
+        f.write("||PULSE:STATUS Second||\n")
+    result = get_log_status(log_path)
+    assert result["status"] == "Second"
+    assert result["summary"] == "Goal"
+    assert _log_tail_state[str(log_path)].offset > offset
+
+
+def test_release_log_tails_prunes_snapshot_state(tmp_path):
+    """Snapshot tails and cached snapshots of dead sessions are dropped with the status tails."""
+    from coral.tools import log_streamer
+    from coral.tools.session_manager import release_log_tails
+
+    live = tmp_path / "claude_coral_live.log"
+    dead = tmp_path / "claude_coral_dead.log"
+    for p in (live, dead):
+        p.write_text("||PULSE:STATUS Work||\n")
+        log_streamer.get_log_snapshot(p)
+    assert log_streamer._snapshot_tails[(str(dead), 200)].buf is None
+
+    release_log_tails({str(live)})
+    assert (str(live), 200) in log_streamer._snapshot_tails
+    assert (str(live), 200) in log_streamer._snapshot_cache
+    assert (str(dead), 200) not in log_streamer._snapshot_tails
+    assert (str(dead), 200) not in log_streamer._snapshot_cache
+
+
+def test_get_log_status_keeps_fd_open_until_released(tmp_path):
+    """Polls reuse one fd; deleting the log or releasing dead agents closes it."""
+    from coral.tools.session_manager import get_log_status, release_log_tails, _log_tail_state
+
+    log_path = tmp_path / "claude_coral_fd.log"
+    log_path.write_text("||PULSE:STATUS First||\n")
+    get_log_status(log_path)
+    fd = _log_tail_state[str(log_path)].fd
+    assert fd is not None
+
+    with open(log_path, "a") as f:
+        f.write("||PULSE:STATUS Second||\n")
+    with patch("coral.tools.session_manager.os.open", side_effect=AssertionError("reopened")):
+        assert get_log_status(log_path)["status"] == "Second"
+    assert _log_tail_state[str(log_path)].fd == fd
+
+    release_log_tails(set())
+    assert str(log_path) not in _log_tail_state
+    with pytest.raises(OSError):
+        os.fstat(fd)
+
+    get_log_status(log_path)
+    log_path.unlink()
+    get_log_status(log_path)
+    assert str(log_path) not in _log_tail_state
+
+
+def test_get_log_statuses_preserves_order_and_missing_logs(tmp_path):
+    """The batch read returns one result per path, in order, including missing logs."""
+    from coral.tools.session_manager import get_log_statuses
+
+    a = tmp_path / "claude_coral_a.log"
+    b = tmp_path / "claude_coral_b.log"
+    a.write_text("||PULSE:STATUS Alpha||\n")
+    b.write_text("||PULSE:STATUS Beta||\n")
+
+    results = get_log_statuses([str(b), str(tmp_path / "missing.log"), str(a)])
+    assert [r["status"] for r in results] == ["Beta", None, "Alpha"]
+    assert results[1]["staleness_seconds"] is None
+
+
+def test_get_log_status_reads_appends_larger_than_reused_buffer(tmp_path):
+    """Appends bigger than the per-log buffer are read whole, with the partial line carried over."""
+    from coral.tools import session_manager
+    from coral.tools.session_manager import get_log_status
+
+    log_path = tmp_path / "claude_coral_big.log"
+    log_path.write_text("||PULSE:STATUS St")
+    get_log_status(log_path)
+
+    filler = "x" * 100 + "\n"
+    with open(log_path, "a") as f:
+        f.write("art||\n" + filler * (session_manager._TAIL_BUF // len(filler) + 10))
+        f.write("||PULSE:SUMMARY Big append||\n")
+    result = get_log_status(log_path)
+    assert result["status"] == "Start"
+    assert result["summary"] == "Big append"
+    assert session_manager._log_tail_state[str(log_path)].offset == log_path.stat().st_size
+
+
+def test_get_log_status_caps_burst_reads_to_tail_window(tmp_path):
+    """Output far beyond the tail window between polls is not parsed in full."""
+    from coral.tools import session_manager
+    from coral.tools.session_manager import get_log_status
+
+    log_path = tmp_path / "claude_coral_burst.log"
+    log_path.write_text("||PULSE:STATUS Start||\nold line\n")
+    get_log_status(log_path)
+
+    filler = "y" * 100 + "\n"
+    with open(log_path, "a") as f:
+        f.write(filler * (3 * session_manager._TAIL_BYTES // len(filler)))
+        f.write("||PULSE:SUMMARY After burst||\n")
+
+    reads = []
+    real_pread_into = session_manager._pread_into
+
+    def pread_into(fd, view, offset):
+        reads.append(len(view))
+        return real_pread_into(fd, view, offset)
+
+    with patch("coral.tools.session_manager._pread_into", pread_into):
+        result = get_log_status(log_path)
+    assert sum(reads) <= session_manager._TAIL_BYTES
+    assert result["status"] == "Start"
+    assert result["summary"] == "After burst"
+    assert "old line" not in result["recent_lines"]
+
+
+def test_get_log_status_burst_keeps_activity_events_from_skipped_output(tmp_path):
+    """PULSE activity events before the tail window still reach the pulse detector."""
+    from coral.tools import session_manager
+    from coral.tools.session_manager import get_log_status
+
+    log_path = tmp_path / "claude_coral_burst_events.log"
+    log_path.write_text("||PULSE:STATUS Start||\n")
+    get_log_status(log_path)
+
+    filler = "y" * 100 + "\n"
+    with open(log_path, "a") as f:
+        f.write("||PULSE:CONFIDENCE \x1b[1mHigh\x1b[0m tests cover it||\n")
+        f.write(filler * (3 * session_manager._TAIL_BYTES // len(filler)))
+        f.write("||PULSE:CONFIDENCE Low the window||\n")
+    get_log_status(log_path)
+
+    state = session_manager._log_tail_state[str(log_path)]
+    assert list(state.events) == [
+        ("confidence", "High tests cover it"),
+        ("confidence", "Low the window"),
+    ]
+
+
+def test_get_log_status_joins_lines_split_across_reads(tmp_path):
+    """A line (or wrapped PULSE tag) written across two polls is parsed once complete."""
+    from coral.tools.session_manager import get_log_status
+
+    log_path = tmp_path / "claude_coral_split.log"
+    log_path.write_text("||PULSE:STATUS Wor")
+    get_log_status(log_path)
+
+    with open(log_path, "a") as f:
+        f.write("king||\n||PULSE:SUMMARY Moving the settings\n")
+    result = get_log_status(log_path)
+    assert result["status"] == "Working"
+
+    with open(log_path, "a") as f:
+        f.write("button to the header||\n")
+    result = get_log_status(log_path)
+    assert result["summary"] == "Moving the settings button to the header"
+
+
+def test_get_log_status_holds_back_whole_open_pulse_chain(tmp_path):
+    """A continuation line that opens another tag still closes the earlier one."""
+    from coral.tools.session_manager import get_log_status
+
+    log_path = tmp_path / "claude_coral_chain.log"
+    log_path.write_text("||PULSE:STATUS Reviewing the\n")
+    get_log_status(log_path)
+
+    # Read boundary here: the continuation arrives in the next poll and
+    # itself ends with an unclosed CONFIDENCE opener
+    with open(log_path, "a") as f:
+        f.write("parser||PULSE:CONFIDENCE High\n")
+    result = get_log_status(log_path)
+    assert result["status"] == "Reviewing the parser"
+
+    with open(log_path, "a") as f:
+        f.write("more output\n")
+    assert get_log_status(log_path)["status"] == "Reviewing the parser"
+
+
+def test_get_log_status_ignores_stat_taken_before_another_read(tmp_path):
+    """A stat that predates a concurrent read mustn't look like a truncation."""
+    from coral.tools.session_manager import get_log_status, _log_tail_state
+
+    log_path = tmp_path / "claude_coral_stale.log"
+    log_path.write_text("||PULSE:CONFIDENCE High a||\n")
+    get_log_status(log_path)
+    stale = log_path.stat()
+    state = _log_tail_state[str(log_path)]
+    state.events.clear()
+
+    with open(log_path, "a") as f:
+        f.write("||PULSE:CONFIDENCE High b||\n")
+    get_log_status(log_path)
+    assert list(state.events) == [("confidence", "High b")]
+
+    # This caller's first stat ran before the read above advanced the tail
+    real_stat = Path.stat
+    stats = iter([stale])
+
+    def stat(self, *args, **kwargs):
+        return next(stats, None) or real_stat(self, *args, **kwargs)
+
+    with patch.object(Path, "stat", stat):
+        get_log_status(log_path)
+    assert _log_tail_state[str(log_path)] is state
+    assert list(state.events) == [("confidence", "High b")]
+
+
+def test_get_log_snapshot_ignores_stat_taken_before_another_read(tmp_path):
+    """A stale stat doesn't reset the snapshot tail and rescan the log."""
+    from coral.tools import log_streamer
+
+    log_path = tmp_path / "claude_coral_stale_snapshot.log"
+    log_path.write_text("||PULSE:STATUS First||\n")
+    log_streamer.get_log_snapshot(log_path)
+    stale = log_path.stat()
+    with open(log_path, "a") as f:
+        f.write("||PULSE:STATUS Second||\n")
+    log_streamer.get_log_snapshot(log_path)
+    state = log_streamer._snapshot_tails[(str(log_path), 200)]
+
+    real_stat = Path.stat
+    stats = iter([stale])
+
+    def stat(self, *args, **kwargs):
+        return next(stats, None) or real_stat(self, *args, **kwargs)
+
+    with patch.object(Path, "stat", stat):
+        result = log_streamer.get_log_snapshot(log_path)
+    assert log_streamer._snapshot_tails[(str(log_path), 200)] is state
+    assert result["status"] == "Second"
+
+
+def test_get_log_status_resets_on_truncation(tmp_path):
+    """A truncated log (agent restart) is re-read from the start."""
+    from coral.tools.session_manager import get_log_status
+
+    log_path = tmp_path / "claude_coral_trunc.log"
+    log_path.write_text("x" * 500 + "\n||PULSE:STATUS Old||\n")
+    assert get_log_status(log_path)["status"] == "Old"
+
+    log_path.write_text("||PULSE:STATUS New||\n")
+    assert get_log_status(log_path)["status"] == "New"
+
+
+def test_get_log_status_follows_replaced_log(tmp_path):
+    """A log recreated at the same path is read from the new file, not the old fd."""
+    from coral.tools.session_manager import get_log_status, release_log_tails
+
+    log_path = tmp_path / "claude_coral_replaced.log"
+    log_path.write_text("||PULSE:STATUS Old||\n")
+    assert get_log_status(log_path)["status"] == "Old"
+
+    replacement = tmp_path / "claude_coral_replaced.log.new"
+    replacement.write_text("||PULSE:STATUS Replaced and longer than before||\n")
+    replacement.replace(log_path)
+    try:
+        assert get_log_status(log_path)["status"] == "Replaced and longer than before"
+    finally:
+        release_log_tails(set())
+
+
+def test_claude_resolve_transcript_path_scans_project_dirs(tmp_path):
+    """Without a working-dir hint the transcript is found in any project dir."""
+    from coral.agents.claude import ClaudeAgent
+
+    (tmp_path / "-home-user-other").mkdir()
+    project = tmp_path / "-home-user-app"
+    (project / "abc-123" / "subagents").mkdir(parents=True)
+    (project / "abc-123" / "subagents" / "agent-1.jsonl").write_text("")
+    (project / "abc-123.jsonl").write_text("")
+
+    with patch("coral.agents.claude.HISTORY_PATH", tmp_path):
+        agent = ClaudeAgent()
+        assert agent.resolve_transcript_path("abc-123") == project / "abc-123.jsonl"
+        assert agent.resolve_transcript_path("abc-123", "/home/user/app") == project / "abc-123.jsonl"
+        assert agent.resolve_transcript_path("missing") is None
+
+
+def test_claude_resolve_transcript_path_falls_back_to_nested_dirs(tmp_path):
+    """A transcript deeper than one project level is still found by the recursive fallback."""
+    from coral.agents.claude import ClaudeAgent
+
+    nested = tmp_path / "-home-user-app" / "archive"
+    nested.mkdir(parents=True)
+    (nested / "old-456.jsonl").write_text("")
+
+    with patch("coral.agents.claude.HISTORY_PATH", tmp_path):
+        assert ClaudeAgent().resolve_transcript_path("old-456") == nested / "old-456.jsonl"
+
+
+# ── get_agent_log_path (session_manager) ──────────────────────────────
+
+
+def test_get_agent_log_path_matches_session_id_and_agent_name(tmp_path):
+    """Log lookup by session_id or agent name, preferring the requested agent type."""
+    from coral.tools.session_manager import get_agent_log_path
+
+    (tmp_path / "gemini_coral_worker.log").write_text("")
+    (tmp_path / "claude_coral_worker.log").write_text("")
+    (tmp_path / "codex_coral_1234-abcd.log").write_text("")
+    (tmp_path / "claude_coral_worker.txt").write_text("")
+    (tmp_path / "unrelated.log").write_text("")
+
+    with patch("coral.tools.session_manager.LOG_DIR", str(tmp_path)):
+        assert get_agent_log_path("x", session_id="1234-abcd") == tmp_path / "codex_coral_1234-abcd.log"
+        assert get_agent_log_path("worker", "claude") == tmp_path / "claude_coral_worker.log"
+        assert get_agent_log_path("worker", "gemini") == tmp_path / "gemini_coral_worker.log"
+        assert get_agent_log_path("worker").name.endswith("_coral_worker.log")
+        assert get_agent_log_path("missing") is None
+
+
+def test_list_coral_logs_cached_by_directory_mtime(tmp_path):
+    """An unchanged log directory is not rescanned; adding a log invalidates the cache."""
+    from coral.tools.session_manager import _list_coral_logs
+
+    (tmp_path / "claude_coral_one.log").write_text("")
+    old = time.time() - 60
+    os.utime(tmp_path, (old, old))
+
+    with patch("coral.tools.session_manager.LOG_DIR", str(tmp_path)):
+        assert [name for _, name, _ in _list_coral_logs()] == ["one"]
+        with patch("coral.tools.session_manager.os.scandir", side_effect=AssertionError("rescanned")):
+            assert [name for _, name, _ in _list_coral_logs()] == ["one"]
+
+        (tmp_path / "claude_coral_two.log").write_text("")
+        assert sorted(name for _, name, _ in _list_coral_logs()) == ["one", "two"]
+
+
+@pytest.mark.asyncio
+async def test_discover_coral_agents_removes_only_stale_orphan_logs(tmp_path):
+    """Orphaned logs older than 5 minutes are deleted; live and fresh logs stay."""
+    sid = "12345678-1234-1234-1234-123456789abc"
+    live = tmp_path / f"claude_coral_{sid}.log"
+    stale = tmp_path / "claude_coral_87654321-4321-4321-4321-cba987654321.log"
+    fresh = tmp_path / "gemini_coral_fresh.log"
+    for p in (live, stale, fresh):
+        p.write_text("")
+    old = time.time() - 600
+    os.utime(live, (old, old))
+    os.utime(stale, (old, old))
+
+    panes = [{
+        "pane_title": "claude", "session_name": f"claude-{sid}",
+        "target": f"claude-{sid}:0.0", "current_path": "/work/agent-1",
+    }]
+    with patch("coral.tools.session_manager.LOG_DIR", str(tmp_path)), \
+         patch("coral.tools.tmux_manager.list_tmux_sessions", AsyncMock(return_value=panes)):
+        agents = await _discover_coral_agents()
+
+    assert [a["log_path"] for a in agents] == [str(live)]
+    assert live.exists() and fresh.exists()
+    assert not stale.exists()
+
+
+@pytest.mark.asyncio
+async def test_discover_coral_agents_skips_sweep_until_orphan_can_be_stale(tmp_path):
+    """An unchanged log directory is not re-swept until a fresh orphan could be old enough."""
+    orphan = tmp_path / "gemini_coral_fresh.log"
+    orphan.write_text("")
+    old = time.time() - 60
+    os.utime(tmp_path, (old, old))
+
+    with patch("coral.tools.session_manager.LOG_DIR", str(tmp_path)), \
+         patch("coral.tools.tmux_manager.list_tmux_sessions", AsyncMock(return_value=[])):
+        await _discover_coral_agents()
+        # Aging the file doesn't touch the directory, so no re-sweep is due yet
+        stale = time.time() - 600
+        os.utime(orphan, (stale, stale))
+        with patch("coral.tools.session_manager.os.unlink", side_effect=AssertionError("swept")):
+            await _discover_coral_agents()
+
+        later = time.time() + 301
+        with patch("coral.tools.session_manager.time.time", return_value=later):
+            await _discover_coral_agents()
+
+    assert not orphan.exists()
+
+
+def test_write_json_atomic_replaces_file_without_leftovers(tmp_path):
+    """State files are written compactly through a temp file that never lingers."""
+    from coral.tools.utils import write_json_atomic
+
+    state_dir = tmp_path / "state"
+    state_dir.mkdir()
+    path = state_dir / "board_state_x.json"
+    path.write_text("old")
+    write_json_atomic(path, {"project": "p", "job_title": "Dev"})
+    assert path.read_text() == '{"project":"p","job_title":"Dev"}'
+
+    with patch("coral.tools.utils.os.replace", side_effect=OSError("disk full")):
+        with pytest.raises(OSError):
+            write_json_atomic(path, {"project": "q"})
+    assert path.read_text() == '{"project":"p","job_title":"Dev"}'
+    assert [p.name for p in state_dir.iterdir()] == ["board_state_x.json"]
+
+
 # ── Message Board: check_unread N+1 ──────────────────────────────────
 
 
@@ -401,8 +879,12 @@ async def test_check_unread_multiple_agents(board_store):
 
 @pytest.mark.asyncio
 async def test_pulse_detector_incremental_scanning():
-    """Verify pulse_detector only reads new content via _file_positions."""
-    from coral.tools.pulse_detector import scan_log_for_pulse_events, _file_positions
+    """Verify pulse_detector only reports events from new content.
+
+    The session list reads each log (get_log_status) before draining its events.
+    """
+    from coral.tools.pulse_detector import scan_log_for_pulse_events
+    from coral.tools.session_manager import _drop_log_tail, get_log_status
 
     mock_store = AsyncMock()
 
@@ -412,16 +894,18 @@ async def test_pulse_detector_incremental_scanning():
         log_path = f.name
 
     try:
-        # Clear any cached position
-        _file_positions.pop(log_path, None)
+        # Clear any cached tail state
+        _drop_log_tail(log_path)
 
         # First scan should find the event
+        get_log_status(log_path)
         await scan_log_for_pulse_events(mock_store, "agent-1", log_path)
         assert mock_store.insert_agent_event.call_count == 1
 
         mock_store.reset_mock()
 
         # Second scan without new content should NOT find new events
+        get_log_status(log_path)
         await scan_log_for_pulse_events(mock_store, "agent-1", log_path)
         assert mock_store.insert_agent_event.call_count == 0
 
@@ -432,17 +916,19 @@ async def test_pulse_detector_incremental_scanning():
         mock_store.reset_mock()
 
         # Third scan should find only the new event
+        get_log_status(log_path)
         await scan_log_for_pulse_events(mock_store, "agent-1", log_path)
         assert mock_store.insert_agent_event.call_count == 1
     finally:
-        _file_positions.pop(log_path, None)
+        _drop_log_tail(log_path)
         os.unlink(log_path)
 
 
 @pytest.mark.asyncio
 async def test_pulse_detector_handles_truncated_file():
     """If log file is truncated (agent restart), scanner should reset."""
-    from coral.tools.pulse_detector import scan_log_for_pulse_events, _file_positions
+    from coral.tools.pulse_detector import scan_log_for_pulse_events
+    from coral.tools.session_manager import _drop_log_tail, get_log_status
 
     mock_store = AsyncMock()
 
@@ -452,7 +938,8 @@ async def test_pulse_detector_handles_truncated_file():
         log_path = f.name
 
     try:
-        _file_positions.pop(log_path, None)
+        _drop_log_tail(log_path)
+        get_log_status(log_path)
         await scan_log_for_pulse_events(mock_store, "agent-1", log_path)
 
         # Truncate the file (simulating restart)
@@ -460,19 +947,56 @@ async def test_pulse_detector_handles_truncated_file():
             f.write("||PULSE:CONFIDENCE Low Restarted||\n")
 
         mock_store.reset_mock()
+        get_log_status(log_path)
         await scan_log_for_pulse_events(mock_store, "agent-1", log_path)
 
         # After truncation detection + re-read, should reset and find new content
         # May need two calls: first detects truncation, second reads
         if mock_store.insert_agent_event.call_count == 0:
+            get_log_status(log_path)
             await scan_log_for_pulse_events(mock_store, "agent-1", log_path)
 
         assert mock_store.insert_agent_event.call_count >= 1
     finally:
-        _file_positions.pop(log_path, None)
+        _drop_log_tail(log_path)
         os.unlink(log_path)
 
 
+@pytest.mark.asyncio
+async def test_pulse_detector_keeps_only_latest_pending_events(tmp_path):
+    """Events not yet drained are capped at _PENDING_EVENTS, newest kept."""
+    from coral.tools import session_manager
+    from coral.tools.pulse_detector import scan_log_for_pulse_events
+
+    cap = session_manager._PENDING_EVENTS
+    log_path = tmp_path / "claude_coral_pending.log"
+    log_path.write_text("".join(f"||PULSE:CONFIDENCE High {i}||\n" for i in range(cap + 5)))
+
+    mock_store = AsyncMock()
+    try:
+        session_manager.get_log_status(str(log_path))
+        await scan_log_for_pulse_events(mock_store, "agent-1", str(log_path))
+    finally:
+        session_manager.release_log_tails(set())
+
+    payloads = [c.args[2] for c in mock_store.insert_agent_event.await_args_list]
+    assert len(payloads) == cap
+    assert payloads[0] == "High 5" and payloads[-1] == f"High {cap + 4}"
+
+
+@pytest.mark.asyncio
+async def test_pulse_detector_never_reads_the_log(tmp_path):
+    """Draining events happens on the event loop, so it must not read the log."""
+    from coral.tools.pulse_detector import scan_log_for_pulse_events
+
+    log_path = tmp_path / "claude_coral_drain.log"
+    log_path.write_text("||PULSE:CONFIDENCE High unread||\n")
+    mock_store = AsyncMock()
+    with patch("coral.tools.session_manager._advance_log_tail", side_effect=AssertionError("read")):
+        await scan_log_for_pulse_events(mock_store, "agent-1", str(log_path))
+    mock_store.insert_agent_event.assert_not_called()
+
+
 # ── Idle Detector ─────────────────────────────────────────────────────
 
 
@@ -584,3 +1108,311 @@ async def test_idle_detector_no_webhooks_configured():
     detector = IdleDetector(mock_store)
     result = await detector.run_once()
     assert result["notifications"] == 0
+
+
+@pytest.mark.asyncio
+async def test_list_tmux_sessions_shares_listing_until_invalidated():
+    """Back-to-back pane lookups should reuse one list-panes subprocess."""
+    from coral.tools import tmux_manager
+
+    calls = []
+
+    async def fake_run_cmd(*args, **kwargs):
+        calls.append(args)
+        return 0, "claude|claude-abc|claude-abc:0.0|/work/agent-1\n", ""
+
+    tmux_manager.invalidate_pane_cache()
+    with patch("coral.tools.tmux_manager.run_cmd", fake_run_cmd):
+        first = await tmux_manager._find_pane("agent-1", session_id="abc")
+        second = await tmux_manager.find_pane_target("agent-1", session_id="abc")
+        assert first["target"] == second == "claude-abc:0.0"
+        assert len(calls) == 1
+
+        tmux_manager.invalidate_pane_cache()
+        await tmux_manager.list_tmux_sessions()
+        assert len(calls) == 2
+    tmux_manager.invalidate_pane_cache()
+
+
+@pytest.mark.asyncio
+async def test_send_auto_accept_uses_single_send_keys():
+    """Auto-accept should send 'y' and Enter in one tmux invocation."""
+    from coral.api import live_sessions
+
+    run = AsyncMock(return_value=(0, "", ""))
+    with patch("coral.tools.utils.run_cmd", run), \
+         patch("coral.api.live_sessions.asyncio.sleep", AsyncMock()):
+        await live_sessions._send_auto_accept("claude-abc")
+
+    run.assert_awaited_once_with(
+        "tmux", "send-keys", "-t", "claude-abc", "y", "Enter", timeout=5.0,
+    )
+
+
+@pytest.mark.asyncio
+async def test_build_session_list_self_heals_missing_log_from_batch_read(tmp_path):
+    """A missing log is recreated using the batch read result, without a separate exists() check."""
+    from coral.api import live_sessions
+
+    existing = tmp_path / "claude_coral_live.log"
+    existing.write_text("||PULSE:STATUS Busy||\n")
+    missing = tmp_path / "claude_coral_gone.log"
+    agents = [
+        {"agent_type": "claude", "agent_name": "a", "session_id": "live",
+         "tmux_session": "claude-live", "log_path": str(existing), "working_directory": ""},
+        {"agent_type": "claude", "agent_name": "b", "session_id": "gone",
+         "tmux_session": "claude-gone", "log_path": str(missing), "working_directory": ""},
+    ]
+    run = AsyncMock(return_value=(0, "", ""))
+    with patch("coral.api.live_sessions.discover_coral_agents", AsyncMock(return_value=agents)), \
+         patch("coral.tools.utils.run_cmd", run):
+        results = await live_sessions._build_session_list()
+
+    by_name = {r["name"]: r for r in results}
+    assert by_name["a"]["status"] == "Busy"
+    assert missing.exists()
+    assert [c.args[:4] for c in run.await_args_list] == [
+        ("tmux", "pipe-pane", "-t", "claude-gone"),
+        ("tmux", "pipe-pane", "-t", "claude-gone"),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_build_session_list_reads_single_log_inline(tmp_path):
+    """Only multi-agent lists pay for the worker-thread hop."""
+    from coral.api import live_sessions
+
+    def agent(name):
+        log = tmp_path / f"claude_coral_{name}.log"
+        log.write_text("||PULSE:STATUS Busy||\n")
+        return {"agent_type": "claude", "agent_name": name, "session_id": name,
+                "tmux_session": None, "log_path": str(log), "working_directory": ""}
+
+    to_thread = AsyncMock(side_effect=lambda fn, *a: fn(*a))
+    with patch("coral.api.live_sessions.asyncio.to_thread", to_thread):
+        with patch("coral.api.live_sessions.discover_coral_agents", AsyncMock(return_value=[agent("one")])):
+            results = await live_sessions._build_session_list()
+        assert results[0]["status"] == "Busy"
+        to_thread.assert_not_awaited()
+
+        with patch("coral.api.live_sessions.discover_coral_agents",
+                   AsyncMock(return_value=[agent("one"), agent("two")])):
+            await live_sessions._build_session_list()
+        to_thread.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_live_session_detail_parses_log_off_the_event_loop(tmp_path):
+    """The detail endpoint hands get_log_snapshot to a worker thread."""
+    from coral.api import live_sessions
+
+    log_path = tmp_path / "claude_coral_detail.log"
+    log_path.write_text("||PULSE:STATUS Reviewing||\n")
+
+    to_thread = AsyncMock(side_effect=lambda fn, *a: fn(*a))
+    with patch("coral.api.live_sessions.get_agent_log_path", return_value=log_path), \
+         patch("coral.api.live_sessions.capture_pane", AsyncMock(return_value="pane")), \
+         patch("coral.api.live_sessions.asyncio.to_thread", to_thread):
+        detail = await live_sessions.get_live_session_detail("agent-1")
+
+    assert detail["status"] == "Reviewing"
+    assert detail["pane_capture"] == "pane"
+    assert to_thread.await_args.args[0] is live_sessions.get_log_snapshot
+
+
+@pytest.mark.asyncio
+async def test_file_content_endpoints_use_worker_threads(tmp_path):
+    """Working-tree file reads and writes run off the event loop."""
+    from coral.api import live_sessions
+
+    to_thread = AsyncMock(side_effect=lambda fn, *a: fn(*a))
+    with patch("coral.api.live_sessions._resolve_workdir", AsyncMock(return_value=str(tmp_path))), \
+         patch("coral.api.live_sessions.asyncio.to_thread", to_thread):
+        saved = await live_sessions.save_file_content("agent-1", {"content": "hello\n"}, filepath="notes.txt")
+        loaded = await live_sessions.get_file_content("agent-1", filepath="notes.txt")
+
+    assert saved == {"ok": True, "filepath": "notes.txt"}
+    assert loaded["content"] == "hello\n"
+    assert [c.args[0] for c in to_thread.await_args_list] == [
+        live_sessions._write_text_file, live_sessions._read_text_file,
+    ]
+
+
+def test_ws_coral_diff_sends_only_changed_sessions():
+    """Unchanged polls send nothing; a later poll sends just the changed session."""
+    from fastapi import WebSocketDisconnect
+    from fastapi.testclient import TestClient
+    from coral.web_server import app
+
+    a = {"session_id": "a", "name": "a", "status": "Idle"}
+    b = {"session_id": "b", "name": "b", "status": "Idle"}
+    polls = [[a, b], [dict(a), dict(b)], [a, dict(b, status="Busy")]]
+
+    async def build(*args, **kwargs):
+        if not polls:
+            raise WebSocketDisconnect()
+        return polls.pop(0)
+
+    with patch("coral.api.live_sessions._build_session_list", build), \
+         patch("coral.api.live_sessions.schedule_store", None), \
+         patch("coral.config.WS_POLL_INTERVAL_S", 0), \
+         patch("coral.config.WS_MIN_INTERVAL_S", 0):
+        with TestClient(app).websocket_connect("/ws/coral") as ws:
+            first = ws.receive_json()
+            second = ws.receive_json()
+
+    assert first["type"] == "coral_update"
+    assert second == {"type": "coral_diff", "changed": [dict(b, status="Busy")]}
+
+
+def test_ws_coral_refreshes_on_change_notification():
+    """notify_sessions_changed wakes the websocket before the heartbeat interval."""
+    from fastapi import WebSocketDisconnect
+    from fastapi.testclient import TestClient
+    from coral.api import live_sessions
+    from coral.web_server import app
+
+    polls = [[{"session_id": "a", "name": "a", "status": "Idle"}],
+             [{"session_id": "a", "name": "a", "status": "Busy"}]]
+
+    async def build(*args, **kwargs):
+        if not polls:
+            raise WebSocketDisconnect()
+        if len(polls) == 2:
+            # Simulate a log write shortly after the first push
+            asyncio.get_running_loop().call_later(0.05, live_sessions.notify_sessions_changed)
+        return polls.pop(0)
+
+    # Only a change notification can wake the client within this test
+    with patch("coral.api.live_sessions._build_session_list", build), \
+         patch("coral.api.live_sessions.schedule_store", None), \
+         patch("coral.config.WS_POLL_INTERVAL_S", 60), \
+         patch("coral.config.WS_MIN_INTERVAL_S", 0):
+        with TestClient(app).websocket_connect("/ws/coral") as ws:
+            ws.receive_json()
+            started = time.monotonic()
+            diff = ws.receive_json()
+            assert time.monotonic() - started < 10
+
+    assert diff["changed"][0]["status"] == "Busy"
+
+
+@pytest.mark.asyncio
+async def test_ws_clients_share_one_session_list_build():
+    """Clients refreshing together await a single _build_session_list."""
+    from coral.api import live_sessions
+
+    calls = 0
+
+    async def build(*args, **kwargs):
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.01)
+        return [{"session_id": "a", "name": "a"}]
+
+    with patch("coral.api.live_sessions._build_session_list", build), \
+         patch("coral.api.live_sessions.schedule_store", None):
+        states = await asyncio.gather(*(live_sessions._shared_ws_state() for _ in range(4)))
+        assert calls == 1
+        assert all(state == states[0] for state in states)
+
+        await live_sessions._shared_ws_state()
+        assert calls == 2
+
+
+@pytest.mark.asyncio
+async def test_change_signal_wakes_all_waiters_and_keeps_missed_changes():
+    """One notify wakes every waiter; a change before waiting returns at once."""
+    from coral.api.live_sessions import _ChangeSignal
+
+    signal = _ChangeSignal()
+    seen = signal.generation
+    waiters = [asyncio.create_task(signal.wait(seen, timeout=5)) for _ in range(3)]
+    await asyncio.sleep(0)
+    signal.notify()
+    await asyncio.wait_for(asyncio.gather(*waiters), timeout=1)
+
+    # A notification that lands while a client is rebuilding is not lost
+    await asyncio.wait_for(signal.wait(seen, timeout=5), timeout=1)
+
+
+@pytest.mark.asyncio
+async def test_watch_log_file_reports_writes(tmp_path):
+    """watch_log_file fires on writes to the watched log."""
+    pytest.importorskip("watchfiles")
+    from coral.background_tasks.log_watcher import watch_log_file
+
+    log_path = tmp_path / "claude_coral_term.log"
+    log_path.write_text("")
+    fired = asyncio.Event()
+    task = asyncio.create_task(watch_log_file(str(log_path), fired.set, debounce_ms=20))
+    try:
+        await asyncio.sleep(0.3)
+        with open(log_path, "a") as f:
+            f.write("output\n")
+        await asyncio.wait_for(fired.wait(), timeout=5)
+        assert not task.done()
+    finally:
+        task.cancel()
+
+
+@pytest.mark.asyncio
+async def test_watch_log_file_follows_replaced_log(tmp_path):
+    """A log deleted and recreated at the same path keeps notifying."""
+    pytest.importorskip("watchfiles")
+    from coral.background_tasks.log_watcher import watch_log_file
+
+    log_path = tmp_path / "claude_coral_term.log"
+    log_path.write_text("")
+    (tmp_path / "other.log").write_text("")
+    fired = asyncio.Event()
+    task = asyncio.create_task(watch_log_file(str(log_path), fired.set, debounce_ms=20))
+    try:
+        await asyncio.sleep(0.3)
+        log_path.unlink()
+        log_path.write_text("")
+        await asyncio.wait_for(fired.wait(), timeout=5)
+        await asyncio.sleep(0.2)
+        fired.clear()
+
+        with open(tmp_path / "other.log", "a") as f:
+            f.write("noise\n")
+        await asyncio.sleep(0.3)
+        assert not fired.is_set()
+
+        with open(log_path, "a") as f:
+            f.write("output\n")
+        await asyncio.wait_for(fired.wait(), timeout=5)
+        assert not task.done()
+    finally:
+        task.cancel()
+
+
+def test_watchfiles_available_reports_missing_package():
+    """ws_terminal checks for watchfiles before choosing notifications over polling."""
+    import sys
+    from coral.background_tasks.log_watcher import watchfiles_available
+
+    with patch.dict(sys.modules, {"watchfiles": None}):
+        assert not watchfiles_available()
+
+
+@pytest.mark.asyncio
+async def test_log_watcher_reports_coral_log_writes(tmp_path):
+    """LogWatcher fires for coral agent logs and ignores other files."""
+    pytest.importorskip("watchfiles")
+    from coral.background_tasks.log_watcher import LogWatcher, _is_coral_log
+
+    assert _is_coral_log(None, "/tmp/claude_coral_abc.log")
+    assert not _is_coral_log(None, "/tmp/other.log")
+
+    fired = asyncio.Event()
+    watcher = LogWatcher(fired.set)
+    with patch("coral.background_tasks.log_watcher.LOG_DIR", str(tmp_path)):
+        task = asyncio.create_task(watcher.run_forever(debounce_ms=50))
+        try:
+            await asyncio.sleep(0.3)
+            (tmp_path / "claude_coral_abc.log").write_text("output\n")
+            await asyncio.wait_for(fired.wait(), timeout=5)
+        finally:
+            task.cancel()
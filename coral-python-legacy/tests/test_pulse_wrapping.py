@@ -163,6 +163,14 @@ class TestRegexAfterRejoin:
         assert len(matches) == 1
         assert "persistent settings store" in clean_match(matches[0])
 
+    def test_single_pipe_kept_in_payload(self):
+        line = "||PULSE:STATUS Piping a | b into c|| trailing ||"
+        assert STATUS_RE.findall(line) == ["Piping a | b into c"]
+
+    def test_unclosed_tag_does_not_match(self):
+        assert STATUS_RE.findall("||PULSE:STATUS still typing | more") == []
+        assert SUMMARY_RE.findall("||PULSE:SUMMARY first line\nsecond||") == []
+
 
 # ---------------------------------------------------------------------------
 # PULSE_EVENT_RE (pulse_detector) multiline matching
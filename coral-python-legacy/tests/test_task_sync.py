@@ -368,3 +368,75 @@ class TestParseResponse:
         parsed = self._parse_response({})
         assert parsed["task_id"] == ""
         assert parsed["subject"] == ""
+
+
+def test_hook_update_patches_cached_dashboard_id(tmp_path, monkeypatch):
+    """TaskUpdate after a hook-created task PATCHes its row without listing all tasks."""
+    import io
+    import json
+    from coral.hooks import task_state
+
+    monkeypatch.setenv("TMPDIR", str(tmp_path))
+    monkeypatch.delenv("TMUX", raising=False)
+    monkeypatch.setattr(task_state, "resolve_agent_type", lambda base, sid: "claude")
+    calls = []
+
+    def fake_api(base, method, path, data=None):
+        calls.append((method, path, data))
+        return {"id": 7, "title": data["title"]} if method == "POST" else None
+
+    monkeypatch.setattr(task_state, "coral_api", fake_api)
+
+    def run_hook(payload):
+        monkeypatch.setattr("sys.stdin", io.StringIO(json.dumps(payload)))
+        task_state.main()
+
+    run_hook(TASK_CREATE_PAYLOAD)
+    calls.clear()
+    run_hook(TASK_UPDATE_COMPLETE_PAYLOAD)
+    assert calls == [("PATCH", "/api/sessions/live/my_agent/tasks/7", {"completed": 1})]
+
+    # The completed row is forgotten; a repeat falls back to the title lookup
+    calls.clear()
+    run_hook(TASK_UPDATE_COMPLETE_PAYLOAD)
+    assert [c[0] for c in calls] == ["GET"]
+
+
+def test_hook_in_progress_skips_row_completed_in_dashboard(tmp_path, monkeypatch):
+    """An in_progress update never reopens a hook-created row the user already completed."""
+    import io
+    import json
+    from coral.hooks import task_state
+
+    monkeypatch.setenv("TMPDIR", str(tmp_path))
+    monkeypatch.delenv("TMUX", raising=False)
+    monkeypatch.setattr(task_state, "resolve_agent_type", lambda base, sid: "claude")
+    calls = []
+
+    def fake_api(base, method, path, data=None):
+        calls.append((method, path, data))
+        if method == "POST":
+            return {"id": 7, "title": data["title"]}
+        if method == "GET":
+            return [{"id": 7, "title": "Fix authentication bug", "completed": 1}]
+        return None
+
+    monkeypatch.setattr(task_state, "coral_api", fake_api)
+
+    def run_hook(payload):
+        monkeypatch.setattr("sys.stdin", io.StringIO(json.dumps(payload)))
+        task_state.main()
+
+    in_progress = json.loads(json.dumps(TASK_UPDATE_COMPLETE_PAYLOAD))
+    in_progress["tool_input"]["status"] = "in_progress"
+    in_progress["tool_response"]["statusChange"]["to"] = "in_progress"
+
+    run_hook(TASK_CREATE_PAYLOAD)
+    calls.clear()
+    run_hook(in_progress)
+    assert [c[0] for c in calls] == ["GET"]
+
+    # The cached row is still used for the completion itself
+    calls.clear()
+    run_hook(TASK_UPDATE_COMPLETE_PAYLOAD)
+    assert calls == [("PATCH", "/api/sessions/live/my_agent/tasks/7", {"completed": 1})]
@@ -1,5 +1,5 @@
 import pytest
-from coral.tools.session_manager import strip_ansi, clean_match
+from coral.tools.session_manager import strip_ansi, clean_match, _strip_ansi_lines
 
 def test_strip_ansi():
     # Test basic string
@@ -11,6 +11,19 @@ def test_strip_ansi():
     # Test with other control chars
     assert strip_ansi("text\x07") == "text"
 
+    # Printable unicode passes through; tabs are kept alongside stripped codes
+    assert strip_ansi("✻ Thinking… ⏺ done") == "✻ Thinking… ⏺ done"
+    assert strip_ansi("a\tb\x1b[1mc") == "a\tb c"
+
+
+def test_strip_ansi_lines_matches_per_line_strip():
+    # An unterminated OSC title must not swallow the following lines
+    data = b"\x1b]0;title\nnext \x1b[32mgreen\x1b[0m\n\xe2\x9c\xbb done\x07\n"
+    expected = [strip_ansi(line.decode("utf-8", errors="replace")) for line in data.split(b"\n")]
+    assert _strip_ansi_lines(data) == expected
+    assert _strip_ansi_lines(data)[:2] == [" ", "next  green "]
+
+
 def test_clean_match():
     # Test standard string
     assert clean_match("  hello   world  ") == "hello world"